@@ -0,0 +1,39 @@
+"""
+setup.py
+
+Optional native build hook for SimpleDB.
+
+setuptools only reads pyproject.toml, and this repository's TOML file is
+named project.toml, so the metadata `pip install .` needs (name, version,
+packages, console script) is declared here and mirrors project.toml. Setting
+SIMPLEDB_MYPYC=1 at install time also compiles simpledb/catalog.py with mypyc
+(requires `mypy` in the build environment):
+
+    SIMPLEDB_MYPYC=1 pip install .
+
+Without the variable the install is pure Python. The compiled module replaces
+simpledb.catalog under the same name, so no import-side fallback is needed.
+"""
+
+import os
+
+from setuptools import find_namespace_packages, setup
+
+ext_modules = []
+if os.environ.get("SIMPLEDB_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    # Only catalog.py is compiled; imported modules are type-checked leniently.
+    ext_modules = mypycify(["--follow-imports=silent", "simpledb/catalog.py"])
+
+setup(
+    name="simpledb",
+    version="0.1.0",
+    description="Educational mini-RDBMS with SQL-like interface and REPL",
+    python_requires=">=3.10",
+    # Subpackages (exec/, index/, storage/, ...) have no __init__.py.
+    packages=find_namespace_packages(include=["simpledb", "simpledb.*"], exclude=["*.__pycache__"]),
+    extras_require={"fast": ["orjson>=3.6"]},
+    entry_points={"console_scripts": ["simpledb = simpledb.__main__:main"]},
+    ext_modules=ext_modules,
+)
@@ -13,12 +13,33 @@ pyproject.toml:
 Implementation notes:
 - We reuse the existing top-level `repl.py` module (installed via py-modules)
   to avoid duplicating CLI logic.
+- `--help` / `--version` are answered before the REPL stack is imported, so
+  they stay fast. Byte-compiling at install time (`python -m compileall`)
+  further trims cold-start import time for the normal path.
 """
 
 from __future__ import annotations
 
 import sys
 
+USAGE = """usage: simpledb [db_dir]
+
+Start the interactive SimpleDB shell on db_dir (default: ./simpledb_data).
+
+options:
+  -h, --help     show this help message and exit
+  -V, --version  show the package version and exit"""
+
+
+def _version() -> str:
+    """Return the installed package version without importing the engine."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("simpledb")
+    except PackageNotFoundError:
+        return "unknown"
+
 
 def main() -> int:
     """
@@ -27,6 +48,16 @@ def main() -> int:
     Returns:
         Exit code (0 for normal exit).
     """
+    # Trivial flags are handled before importing the REPL (and its dependencies).
+    if len(sys.argv) > 1:
+        flag = sys.argv[1]
+        if flag in ("-h", "--help"):
+            print(USAGE)
+            return 0
+        if flag in ("-V", "--version"):
+            print(f"simpledb {_version()}")
+            return 0
+
     # Import here so packaging/runtime errors show cleanly at entry time.
     from repl import main as repl_main  # type: ignore
 
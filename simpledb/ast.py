@@ -8,6 +8,9 @@ The executor then uses the AST to perform DDL/DML operations.
 
 Design notes:
 - We keep the AST small and explicit, supporting only the required SQL subset.
+- Nodes are frozen, slotted dataclasses: no per-instance __dict__, cheap to allocate.
+  attrs' frozen slotted classes construct no faster (both set fields through
+  object.__setattr__), so the AST stays on the stdlib with no extra dependency.
 - Column references can be qualified (table.column) to support JOIN queries.
 - WHERE supports only conjunctions of equality predicates (col = literal AND ...).
 """
@@ -22,9 +25,10 @@ from typing import Any
 
 class Statement:
     """Base class marker for all statements."""
+    __slots__ = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TypeSpec:
     """
     Type specification for a column.
@@ -32,12 +36,20 @@ class TypeSpec:
     Attributes:
         name: Uppercased type name, e.g. "INTEGER", "VARCHAR", "DATE".
         params: Optional integer parameters, e.g. VARCHAR(255) => [255].
+
+    Notes:
+        The name is normalized to uppercase on construction, so consumers can
+        compare it directly without calling upper() again.
     """
     name: str
     params: list[int]
 
+    def __post_init__(self) -> None:
+        if not self.name.isupper():
+            object.__setattr__(self, "name", self.name.upper())
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ColumnDef:
     """
     Column definition in CREATE TABLE.
@@ -56,7 +68,7 @@ class ColumnDef:
     primary_key: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ColumnRef:
     """
     Reference to a column in SELECT / WHERE / JOIN ON.
@@ -69,7 +81,7 @@ class ColumnRef:
     table: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Condition:
     """
     WHERE condition.
@@ -84,7 +96,7 @@ class Condition:
     right: Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WhereClause:
     """
     WHERE clause represented as AND-separated conditions.
@@ -97,14 +109,14 @@ class WhereClause:
 
 # ---------- Statements ----------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CreateTable(Statement):
     """CREATE TABLE statement."""
     table_name: str
     columns: list[ColumnDef]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CreateIndex(Statement):
     """CREATE INDEX statement."""
     index_name: str
@@ -112,7 +124,7 @@ class CreateIndex(Statement):
     column_name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Insert(Statement):
     """INSERT statement."""
     table_name: str
@@ -120,7 +132,7 @@ class Insert(Statement):
     values: list[Any]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JoinClause:
     """
     JOIN clause for INNER JOIN.
@@ -135,7 +147,7 @@ class JoinClause:
     right: ColumnRef
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Select(Statement):
     """
     SELECT statement.
@@ -152,14 +164,14 @@ class Select(Statement):
     where: WhereClause | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Assignment:
     """A single SET assignment in UPDATE."""
     column: str
     value: Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Update(Statement):
     """UPDATE statement."""
     table_name: str
@@ -167,7 +179,7 @@ class Update(Statement):
     where: WhereClause | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Delete(Statement):
     """DELETE statement."""
     table_name: str
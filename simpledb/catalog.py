@@ -10,6 +10,7 @@ Responsibilities:
 
 Persistence:
 - Stored at: <db_dir>/catalog.json
+- Uses orjson when installed (faster load/save); falls back to stdlib json.
 
 Design notes:
 - This is a small educational RDBMS, so the catalog is intentionally simple.
@@ -19,20 +20,55 @@ Design notes:
 
 from __future__ import annotations
 
+import hashlib
 import json
-from dataclasses import dataclass
+import os
+import sys
+from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, KeysView, MutableMapping
 
 from .ast import ColumnDef, TypeSpec
 from .errors import ExecutionError
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; stdlib json produces the same catalog layout.
+    orjson = None  # type: ignore[assignment]
+
 CATALOG_FILE = "catalog.json"
 
-SUPPORTED_TYPES = {"INTEGER", "VARCHAR", "TEXT", "DATE", "BOOLEAN"}
+SUPPORTED_TYPES = frozenset({"INTEGER", "VARCHAR", "TEXT", "DATE", "BOOLEAN"})
+
+# (column name, check(value) -> bool, error message); see TableMeta.type_checks()
+TypeCheck = tuple[str, Callable[[Any], bool], str]
+
+
+def _is_integer(v: Any) -> bool:
+    # bool is a subclass of int in Python, so explicitly reject.
+    return isinstance(v, int) and not isinstance(v, bool)
+
+
+def _is_str(v: Any) -> bool:
+    return isinstance(v, str)
+
+
+def _is_bool(v: Any) -> bool:
+    return isinstance(v, bool)
+
 
+def _fits_length(max_len: int, v: Any) -> bool:
+    # Bound to a VARCHAR(n) limit with functools.partial in type_checks().
+    return len(v) <= max_len
 
-@dataclass
+
+def _never(v: Any) -> bool:
+    return False
+
+
+@dataclass(slots=True)
 class IndexMeta:
     """
     Index metadata.
@@ -47,7 +83,7 @@ class IndexMeta:
     column_name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TableMeta:
     """
     Table metadata stored in the catalog.
@@ -56,21 +92,32 @@ class TableMeta:
         name: Table name.
         columns: Column definitions (name/type/constraints).
         indexes: Index metadata keyed by index name.
+        indexes_by_column: Index metadata keyed by indexed column (first index
+                           per column wins); kept in sync by Catalog.add_index().
     """
     name: str
     columns: list[ColumnDef]
     indexes: dict[str, IndexMeta]
-
-    def column_names(self) -> set[str]:
-        """Return the set of column names in this table."""
-        return {c.name for c in self.columns}
+    indexes_by_column: dict[str, IndexMeta] = field(init=False, repr=False, compare=False)
+    _by_name: dict[str, ColumnDef] = field(init=False, repr=False, compare=False)
+    _pk: str | None = field(init=False, repr=False, compare=False)
+    _type_checks: list[TypeCheck] | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Columns are immutable after CREATE TABLE, so derived lookups are built once.
+        self._by_name = {c.name: c for c in self.columns}
+        self._pk = next((c.name for c in self.columns if c.primary_key), None)
+        self.indexes_by_column = {}
+        for idx in self.indexes.values():
+            self.indexes_by_column.setdefault(idx.column_name, idx)
+
+    def column_names(self) -> KeysView[str]:
+        """Return the column names in this table (a read-only set-like view)."""
+        return self._by_name.keys()
 
     def get_column(self, name: str) -> ColumnDef | None:
         """Return ColumnDef by name, or None if not found."""
-        for c in self.columns:
-            if c.name == name:
-                return c
-        return None
+        return self._by_name.get(name)
 
     def primary_key_column(self) -> str | None:
         """
@@ -79,25 +126,176 @@ class TableMeta:
         Note:
             This DB supports only ONE primary key column per table.
         """
-        pks = [c.name for c in self.columns if c.primary_key]
-        if not pks:
-            return None
-        return pks[0]
+        return self._pk
+
+    def type_checks(self) -> list[TypeCheck]:
+        """
+        Return the per-column value checks for this table's schema.
+
+        Built once on first use: each entry pairs a column with a check that
+        must hold for non-NULL values and the error message to raise otherwise.
+        VARCHAR contributes two entries (string, then length), in that order.
+        """
+        if self._type_checks is not None:
+            return self._type_checks
 
+        checks: list[TypeCheck] = []
+        for c in self.columns:
+            t = c.typ.name
+            where = f"{self.name}.{c.name}"
+            if t == "INTEGER":
+                checks.append((c.name, _is_integer, f"Type error: {where} expects INTEGER"))
+            elif t in ("TEXT", "DATE", "VARCHAR"):
+                checks.append((c.name, _is_str, f"Type error: {where} expects TEXT/DATE"))
+                if t == "VARCHAR":
+                    max_len = c.typ.params[0]
+                    checks.append(
+                        (c.name, partial(_fits_length, max_len), f"Type error: {where} exceeds VARCHAR({max_len})")
+                    )
+            elif t == "BOOLEAN":
+                checks.append((c.name, _is_bool, f"Type error: {where} expects BOOLEAN"))
+            else:
+                checks.append((c.name, _never, f"Unsupported type: {t}"))
+
+        self._type_checks = checks
+        return checks
+
+
+# Catalog.load builds many frozen AST nodes; bypassing the generated __init__
+# (one object.__setattr__ call per field either way) saves a Python frame each.
+_new = object.__new__
+_set = object.__setattr__
+
+
+def _fast_new_typespec(name: str, params: list[int]) -> TypeSpec:
+    """Construct a TypeSpec without running its __init__ (name must be uppercase)."""
+    o = _new(TypeSpec)
+    _set(o, "name", name)
+    _set(o, "params", params)
+    return o
+
+
+def _fast_new_columndef(name: str, typ: TypeSpec, not_null: bool, unique: bool, primary_key: bool) -> ColumnDef:
+    """Construct a ColumnDef without running its __init__."""
+    o = _new(ColumnDef)
+    _set(o, "name", name)
+    _set(o, "typ", typ)
+    _set(o, "not_null", not_null)
+    _set(o, "unique", unique)
+    _set(o, "primary_key", primary_key)
+    return o
+
+
+def _build_index_meta(iname: str, im: dict[str, Any]) -> IndexMeta:
+    """
+    Deserialize one index entry of catalog.json into an IndexMeta.
+
+    Names are interned: they repeat across tables/indexes and are used as dict
+    keys throughout the executor.
+    """
+    return IndexMeta(
+        name=sys.intern(iname),
+        table_name=sys.intern(im["table_name"]),
+        column_name=sys.intern(im["column_name"]),
+    )
+
+
+def _build_table_meta(tname: str, t: dict[str, Any], t_indexes: dict[str, IndexMeta]) -> TableMeta:
+    """
+    Deserialize one table entry of catalog.json into a TableMeta.
 
-@dataclass
+    Args:
+        tname: Table name.
+        t: Raw JSON fragment for the table.
+        t_indexes: This table's indexes, taken from the catalog's global index
+                   map (the single persisted source of index metadata).
+
+    Returns:
+        TableMeta instance.
+    """
+    cols: list[ColumnDef] = []
+    for c in t.get("columns", []):
+        typ_raw = c.get("typ", {})
+        typ = _fast_new_typespec(
+            sys.intern(str(typ_raw.get("name", "")).upper()),
+            list(typ_raw.get("params", [])),
+        )
+        cols.append(
+            _fast_new_columndef(
+                sys.intern(c["name"]),
+                typ,
+                bool(c.get("not_null", False)),
+                bool(c.get("unique", False)),
+                bool(c.get("primary_key", False)),
+            )
+        )
+
+    return TableMeta(name=sys.intern(tname), columns=cols, indexes=t_indexes)
+
+
+def _digest(payload: bytes) -> bytes:
+    """Return a short content hash used to detect no-op catalog saves."""
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+class _LazyTableDict(dict):
+    """
+    Table mapping that materializes TableMeta entries on first access.
+
+    Catalog.load stores the raw JSON fragment for every table; the fragment is
+    turned into a TableMeta (and cached back into the dict) the first time the
+    table is read. Keys are known up front, so membership tests and listing
+    table names never deserialize anything.
+    """
+
+    def __init__(self, raw_tables: dict[str, Any], indexes: dict[str, IndexMeta]):
+        super().__init__(raw_tables)
+        self._indexes_by_table: dict[str, dict[str, IndexMeta]] = {}
+        for iname, idx in indexes.items():
+            self._indexes_by_table.setdefault(idx.table_name, {})[iname] = idx
+
+    def __getitem__(self, key: str) -> TableMeta:
+        val = super().__getitem__(key)
+        if not isinstance(val, TableMeta):
+            val = _build_table_meta(key, val, self._indexes_by_table.pop(key, {}))
+            super().__setitem__(key, val)
+        return val
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            return default
+        return self[key]
+
+    def values(self):
+        return [self[k] for k in self]
+
+    def items(self):
+        return [(k, self[k]) for k in self]
+
+
+@dataclass(slots=True)
 class Catalog:
     """
     Database catalog containing all tables and indexes.
 
     Attributes:
         version: Catalog format version (for future migrations).
-        tables: Mapping of table name -> TableMeta.
+        tables: Mapping of table name -> TableMeta (lazily materialized after load).
         indexes: Mapping of index name -> IndexMeta (global namespace).
+        _generation: Bumped by mark_dirty(); keys derived caches such as
+                     sorted_table_names().
+
+    Notes:
+        Callers that mutate tables/indexes must call mark_dirty() before save();
+        save() is a no-op for a clean catalog whose on-disk digest is known.
     """
     version: int
-    tables: dict[str, TableMeta]
+    tables: MutableMapping[str, TableMeta]
     indexes: dict[str, IndexMeta]
+    _dirty: bool = field(default=False, repr=False, compare=False)
+    _last_digest: bytes | None = field(default=None, repr=False, compare=False)
+    _generation: int = field(default=0, repr=False, compare=False)
+    _sorted_names: tuple[int, list[str]] | None = field(default=None, repr=False, compare=False)
 
     @classmethod
     def empty(cls) -> "Catalog":
@@ -119,61 +317,49 @@ class Catalog:
         if not path.exists():
             return cls.empty()
 
-        raw = json.loads(path.read_text(encoding="utf-8"))
+        data = path.read_bytes()
+        if orjson is not None:
+            raw = orjson.loads(data)
+        else:
+            raw = json.loads(data)
         version = int(raw.get("version", 1))
 
-        tables: dict[str, TableMeta] = {}
-        indexes: dict[str, IndexMeta] = {}
-
-        # Deserialize tables
-        for tname, t in raw.get("tables", {}).items():
-            cols: list[ColumnDef] = []
-            for c in t.get("columns", []):
-                typ_raw = c.get("typ", {})
-                typ = TypeSpec(
-                    name=str(typ_raw.get("name", "")).upper(),
-                    params=list(typ_raw.get("params", [])),
-                )
-                cols.append(
-                    ColumnDef(
-                        name=c["name"],
-                        typ=typ,
-                        not_null=bool(c.get("not_null", False)),
-                        unique=bool(c.get("unique", False)),
-                        primary_key=bool(c.get("primary_key", False)),
-                    )
-                )
+        # Index metadata is small, so build it eagerly in one expression; table
+        # entries stay raw until first access (see _LazyTableDict), and the
+        # table dict is copied from the parsed mapping, so it is sized once.
+        raw_tables = raw.get("tables", {})
+        indexes: dict[str, IndexMeta] = {
+            iname: _build_index_meta(iname, im) for iname, im in raw.get("indexes", {}).items()
+        }
 
-            t_indexes: dict[str, IndexMeta] = {}
+        # Catalogs written by older versions also listed indexes per table.
+        for t in raw_tables.values():
             for iname, im in t.get("indexes", {}).items():
-                idx = IndexMeta(
-                    name=iname,
-                    table_name=im["table_name"],
-                    column_name=im["column_name"],
-                )
-                t_indexes[iname] = idx
-                indexes[iname] = idx
-
-            tables[tname] = TableMeta(name=tname, columns=cols, indexes=t_indexes)
-
-        # Optional: merge any global index list (kept for forward compatibility)
-        for iname, im in raw.get("indexes", {}).items():
-            if iname not in indexes:
-                indexes[iname] = IndexMeta(
-                    name=iname,
-                    table_name=im["table_name"],
-                    column_name=im["column_name"],
-                )
-
-        return cls(version=version, tables=tables, indexes=indexes)
+                if iname not in indexes:
+                    indexes[iname] = _build_index_meta(iname, im)
+
+        tables = _LazyTableDict(raw_tables, indexes)
+        return cls(version=version, tables=tables, indexes=indexes, _last_digest=_digest(data))
+
+    def mark_dirty(self) -> None:
+        """Flag the catalog as modified so the next save() writes it."""
+        self._dirty = True
+        self._generation += 1
 
     def save(self, db_dir: Path) -> None:
         """
         Persist catalog state to <db_dir>/catalog.json.
 
+        The file is replaced atomically (temp file + os.replace). Nothing is
+        written if the catalog is clean or serializes to the same bytes as the
+        last load/save.
+
         Args:
             db_dir: Database root directory.
         """
+        if not self._dirty and self._last_digest is not None:
+            return
+
         path = db_dir / CATALOG_FILE
 
         def col_to_dict(c: ColumnDef) -> dict[str, Any]:
@@ -185,15 +371,11 @@ class Catalog:
                 "primary_key": c.primary_key,
             }
 
+        # Indexes are persisted once, in the global map; TableMeta.indexes is
+        # rebuilt from it on load.
         tables_dict: dict[str, Any] = {}
         for tname, t in self.tables.items():
-            tables_dict[tname] = {
-                "columns": [col_to_dict(c) for c in t.columns],
-                "indexes": {
-                    iname: {"table_name": idx.table_name, "column_name": idx.column_name}
-                    for iname, idx in t.indexes.items()
-                },
-            }
+            tables_dict[tname] = {"columns": [col_to_dict(c) for c in t.columns]}
 
         out = {
             "version": self.version,
@@ -204,10 +386,55 @@ class Catalog:
             },
         }
 
-        path.write_text(json.dumps(out, indent=2, sort_keys=True), encoding="utf-8")
+        if orjson is not None:
+            payload = orjson.dumps(out, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+        else:
+            payload = json.dumps(out, indent=2, sort_keys=True).encode("utf-8")
+
+        digest = _digest(payload)
+        if digest != self._last_digest:
+            # Write-then-rename so a crash mid-write never leaves a truncated catalog.
+            tmp = path.with_suffix(".json.tmp")
+            tmp.write_bytes(payload)
+            os.replace(tmp, path)
+            self._last_digest = digest
+        # Only now is the file known to match; if the write raised, the next
+        # save() tries again.
+        self._dirty = False
+
+    # ---------- mutation helpers ----------
+
+    def add_index(self, idx: IndexMeta) -> None:
+        """
+        Register index metadata globally and on its table, and mark the catalog dirty.
+
+        Args:
+            idx: Index metadata (its table must exist).
+        """
+        self.indexes[idx.name] = idx
+        table = self.require_table(idx.table_name)
+        table.indexes[idx.name] = idx
+        table.indexes_by_column.setdefault(idx.column_name, idx)
+        self.mark_dirty()
 
     # ---------- lookup helpers ----------
 
+    def sorted_table_names(self) -> list[str]:
+        """
+        Return all table names in sorted order.
+
+        The list is cached until the next mark_dirty(), so repeated listings
+        (e.g. the REPL's .tables) do not re-sort an unchanged schema.
+
+        Returns:
+            Sorted table names (shared; treat as read-only).
+        """
+        cached = self._sorted_names
+        if cached is None or cached[0] != self._generation:
+            cached = (self._generation, sorted(self.tables.keys()))
+            self._sorted_names = cached
+        return cached[1]
+
     def require_table(self, table_name: str) -> TableMeta:
         """
         Fetch a table by name or raise ExecutionError.
@@ -238,7 +465,7 @@ class Catalog:
         Raises:
             ExecutionError: if type is unsupported or invalid parameters.
         """
-        tname = typ.name.upper()
+        tname = typ.name
         if tname not in SUPPORTED_TYPES:
             raise ExecutionError(f"Unsupported type: {typ.name}")
 
@@ -269,15 +496,17 @@ class Catalog:
         if table_name in self.tables:
             raise ExecutionError(f"Table already exists: {table_name}")
 
-        col_names = [c.name for c in columns]
-        if len(set(col_names)) != len(col_names):
-            raise ExecutionError("Duplicate column name in CREATE TABLE")
-
-        pk_cols = [c.name for c in columns if c.primary_key]
-        if len(pk_cols) > 1:
-            raise ExecutionError("Only one PRIMARY KEY column is supported")
-
+        # Single pass over the columns; fail on the first violation.
+        seen: set[str] = set()
+        pk_count = 0
         for c in columns:
+            if c.name in seen:
+                raise ExecutionError("Duplicate column name in CREATE TABLE")
+            seen.add(c.name)
+            if c.primary_key:
+                pk_count += 1
+                if pk_count > 1:
+                    raise ExecutionError("Only one PRIMARY KEY column is supported")
             self.validate_type(c.typ)
 
     def validate_create_index(self, index_name: str, table_name: str, column_name: str) -> None:
@@ -10,6 +10,15 @@ Responsibilities:
     - db.execute_script(sql_script) -> list[CommandOk|QueryResult]
 - Load/persist the schema catalog
 - Maintain an index cache shared across executions (performance + fewer disk reads)
+- Memoize open databases per directory so repeated Database.open() calls in one
+  process (e.g. one per web request) reuse the loaded catalog
+
+Thread safety:
+- A memoized Database is shared by every caller that opens its path, along
+  with its executor's row caches, unique-value cache and heaps' next_rid.
+  None of that is thread-safe on its own, so execute()/execute_script() run
+  one at a time per Database under an instance lock. Concurrent requests on
+  the same database are serialized, not run in parallel.
 
 This module is intentionally minimal so it can be used from:
 - the REPL (repl.py)
@@ -18,6 +27,7 @@ This module is intentionally minimal so it can be used from:
 
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -27,6 +37,10 @@ from .index.hash_index import HashIndex
 from .parser import parse_script, parse_sql
 
 
+_OPEN_DBS: dict[Path, "Database"] = {}
+_OPEN_LOCK = threading.Lock()
+
+
 @dataclass
 class Database:
     """
@@ -36,26 +50,65 @@ class Database:
         root_dir: DB root folder on disk.
         catalog: Loaded schema catalog.
         index_cache: Cache of opened HashIndex objects.
+        executor: Executor bound to this database, reused across execute() calls.
+        _lock: Serializes statements on this (possibly shared) instance.
     """
     root_dir: Path
     catalog: Catalog
     index_cache: dict[str, HashIndex] = field(default_factory=dict)
+    executor: Executor = field(init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Executor holds no per-statement state, so one instance serves every call.
+        self.executor = Executor(db_dir=self.root_dir, catalog=self.catalog, index_cache=self.index_cache)
 
     @classmethod
     def open(cls, path: str | Path) -> "Database":
         """
         Open (or create) a database at a directory path.
 
+        Instances are memoized per resolved directory: opening the same path
+        again returns the same (shared) Database, so changes made through one
+        handle are visible through all of them. Use Database.close(path) to
+        drop the cached instance, e.g. after the directory changed on disk.
+
         Args:
             path: Directory path (string or Path). If it doesn't exist, it is created.
 
         Returns:
             Database instance.
         """
-        root = Path(path)
-        root.mkdir(parents=True, exist_ok=True)
-        catalog = Catalog.load(root)
-        return cls(root_dir=root, catalog=catalog)
+        root = Path(path).resolve()
+        with _OPEN_LOCK:
+            db = _OPEN_DBS.get(root)
+            if db is None:
+                root.mkdir(parents=True, exist_ok=True)
+                catalog = Catalog.load(root)
+                db = cls(root_dir=root, catalog=catalog)
+                _OPEN_DBS[root] = db
+            return db
+
+    @classmethod
+    def close(cls, path: str | Path) -> None:
+        """
+        Close a memoized Database so the next open() reloads it from disk.
+
+        The instance is evicted from the cache and its cached heaps are
+        closed (buffered writes flushed, file handles released).
+
+        Args:
+            path: Directory path previously passed to open(). Unknown paths are ignored.
+        """
+        with _OPEN_LOCK:
+            db = _OPEN_DBS.pop(Path(path).resolve(), None)
+        if db is None:
+            return
+        with db._lock:
+            heaps = db.executor.heap_cache
+            for heap in heaps.values():
+                heap.close()
+            heaps.clear()
 
     def execute(self, sql: str):
         """
@@ -71,9 +124,9 @@ class Database:
             SqlSyntaxError: on parse errors.
             ExecutionError / ConstraintError: on execution failure.
         """
-        stmt = parse_sql(sql)
-        ex = Executor(db_dir=self.root_dir, catalog=self.catalog, index_cache=self.index_cache)
-        return ex.execute(stmt)
+        stmt = parse_sql(sql)  # memoized by SQL text
+        with self._lock:
+            return self.executor.execute(stmt)
 
     def execute_script(self, sql: str):
         """
@@ -86,5 +139,6 @@ class Database:
             List of results in statement order.
         """
         stmts = parse_script(sql)
-        ex = Executor(db_dir=self.root_dir, catalog=self.catalog, index_cache=self.index_cache)
-        return [ex.execute(s) for s in stmts]
\ No newline at end of file
+        execute = self.executor.execute
+        with self._lock:
+            return [execute(s) for s in stmts]
\ No newline at end of file
@@ -23,7 +23,7 @@ class SimpleDBError(Exception):
     """
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Position:
     """
     Represents a location in an input SQL string.
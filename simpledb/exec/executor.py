@@ -19,9 +19,9 @@ Core design:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator
 
 from ..ast import (
     ColumnRef,
@@ -32,13 +32,15 @@ from ..ast import (
     Select,
     Statement,
     Update,
+    WhereClause,
 )
 from ..catalog import Catalog, IndexMeta, TableMeta
 from ..errors import ConstraintError, ExecutionError
 from ..index.hash_index import HashIndex
 from ..result import CommandOk, QueryResult
 from ..storage.heap import HeapTable
-from .join import CombinedRow, inner_join, where_matches
+from .join import JoinBatch, inner_join, resolve_batch_where
+from .predicate import compile_equalities, compile_scan, resolve_where
 
 
 @dataclass
@@ -50,10 +52,18 @@ class Executor:
         db_dir: Database root directory.
         catalog: In-memory Catalog (also persisted as catalog.json).
         index_cache: Cache of loaded HashIndex objects (kept at Database level).
+
+    Attributes:
+        heap_cache: Opened HeapTable objects by table name. Keeping them open
+                    lets each heap serve repeated scans from its row cache.
+        _unique_cache: Per-table sets of existing PRIMARY KEY / UNIQUE values,
+                       built on first use and maintained by DML.
     """
     db_dir: Path
     catalog: Catalog
     index_cache: dict[str, HashIndex]
+    heap_cache: dict[str, HeapTable] = field(default_factory=dict, repr=False)
+    _unique_cache: dict[str, dict[str, set[Any]]] = field(default_factory=dict, repr=False)
 
     # --------------------------
     # public entry point
@@ -88,9 +98,25 @@ class Executor:
         raise ExecutionError(f"Unsupported statement: {type(stmt).__name__}")
 
     # --------------------------
-    # index helpers
+    # storage / index helpers
     # --------------------------
 
+    def _open_heap(self, table_name: str) -> HeapTable:
+        """
+        Open a table's heap storage from cache/disk.
+
+        Args:
+            table_name: Table name.
+
+        Returns:
+            HeapTable instance (cached).
+        """
+        heap = self.heap_cache.get(table_name)
+        if heap is None:
+            heap = HeapTable.open(self.db_dir, table_name)
+            self.heap_cache[table_name] = heap
+        return heap
+
     def _index_path(self, index_name: str) -> Path:
         """Return the filesystem path for an index JSON file."""
         return self.db_dir / "indexes" / f"{index_name}.json"
@@ -130,6 +156,20 @@ class Executor:
         """
         return [self._open_index(m) for m in table.indexes.values()]
 
+    @staticmethod
+    def _save_dirty_indexes(indexes: list[HashIndex]) -> None:
+        """
+        Persist the indexes a statement changed, once per statement.
+
+        Clean indexes (e.g. when no rows matched, or only NULLs were
+        involved) are not rewritten.
+
+        Args:
+            indexes: Indexes touched by the statement.
+        """
+        for idx in indexes:
+            idx.save_if_dirty()
+
     # --------------------------
     # DDL
     # --------------------------
@@ -149,10 +189,11 @@ class Executor:
 
         table = TableMeta(name=stmt.table_name, columns=stmt.columns, indexes={})
         self.catalog.tables[stmt.table_name] = table
+        self.catalog.mark_dirty()
         self.catalog.save(self.db_dir)
 
         # Ensure storage exists
-        HeapTable.open(self.db_dir, stmt.table_name)
+        self._open_heap(stmt.table_name)
 
         return CommandOk(rows_affected=0, message=f"Table created: {stmt.table_name}")
 
@@ -170,18 +211,22 @@ class Executor:
         self.catalog.validate_create_index(stmt.index_name, stmt.table_name, stmt.column_name)
 
         idx_meta = IndexMeta(name=stmt.index_name, table_name=stmt.table_name, column_name=stmt.column_name)
-        self.catalog.indexes[stmt.index_name] = idx_meta
-
-        table = self.catalog.require_table(stmt.table_name)
-        table.indexes[stmt.index_name] = idx_meta
+        self.catalog.add_index(idx_meta)
         self.catalog.save(self.db_dir)
 
         # Build index from storage
-        heap = HeapTable.open(self.db_dir, stmt.table_name)
+        heap = self._open_heap(stmt.table_name)
         idx = self._open_index(idx_meta)
-        idx.clear()
+        buckets: dict[Any, list[int]] = {}
+        col = stmt.column_name
         for row in heap.scan_active():
-            idx.add(row.get(stmt.column_name), int(row["_rid"]))
+            v = row[col]
+            bucket = buckets.get(v)
+            if bucket is None:
+                buckets[v] = [row["_rid"]]
+            else:
+                bucket.append(row["_rid"])
+        idx.bulk_load(buckets)
         idx.save()
 
         return CommandOk(
@@ -204,33 +249,10 @@ class Executor:
         Raises:
             ExecutionError on type mismatch.
         """
-        for col_def in table.columns:
-            if col_def.name not in row:
-                continue
-            val = row[col_def.name]
-            if val is None:
-                continue
-
-            t = col_def.typ.name.upper()
-
-            if t == "INTEGER":
-                # bool is a subclass of int in Python, so explicitly reject.
-                if not isinstance(val, int) or isinstance(val, bool):
-                    raise ExecutionError(f"Type error: {table.name}.{col_def.name} expects INTEGER")
-            elif t in ("TEXT", "DATE", "VARCHAR"):
-                if not isinstance(val, str):
-                    raise ExecutionError(f"Type error: {table.name}.{col_def.name} expects TEXT/DATE")
-                if t == "VARCHAR":
-                    max_len = col_def.typ.params[0]
-                    if len(val) > max_len:
-                        raise ExecutionError(
-                            f"Type error: {table.name}.{col_def.name} exceeds VARCHAR({max_len})"
-                        )
-            elif t == "BOOLEAN":
-                if not isinstance(val, bool):
-                    raise ExecutionError(f"Type error: {table.name}.{col_def.name} expects BOOLEAN")
-            else:
-                raise ExecutionError(f"Unsupported type: {t}")
+        for name, check, err in table.type_checks():
+            val = row.get(name)
+            if val is not None and not check(val):
+                raise ExecutionError(err)
 
     def _resolve_col_single_table(self, table_name: str, colref: ColumnRef, ctx: str) -> str:
         """
@@ -251,75 +273,212 @@ class Executor:
             raise ExecutionError(f"{ctx}: column qualifier {colref.table}.{colref.column} does not match {table_name}")
         return colref.column
 
-    def _row_matches_where_single_table(self, table_name: str, row: dict[str, Any], where) -> bool:
+    def _prepare_where(self, table: TableMeta, where: WhereClause | None) -> list[tuple[str, Any]]:
         """
-        Evaluate WHERE conditions against a single-table row dict.
+        Resolve a single-table WHERE clause into (column, literal) pairs.
+
+        Operators, column qualifiers and column names are validated here, once
+        per statement; every later step (planning, filtering, scanning) works
+        on the resulting pairs and never re-inspects the AST per row.
+
+        Args:
+            table: Table in scope.
+            where: WhereClause or None.
+
+        Returns:
+            (column name, literal value) pairs combined with AND.
+
+        Raises:
+            ExecutionError on unsupported operators, mismatched qualifiers or
+            unknown columns.
+        """
+        if where is not None:
+            for cond in where.conditions:
+                self._resolve_col_single_table(table.name, cond.left, "WHERE")
+        return resolve_where(where, {c: c for c in table.column_names()})
+
+    def _analyze_where(self, table: TableMeta, where: WhereClause | None) -> tuple[str, list[tuple[str, Any]]]:
+        """
+        Prepare and fold a single-table WHERE clause before planning.
+
+        The clause is validated first (so errors surface as usual), then:
+        - no conditions at all -> "true"
+        - two equalities on the same column whose literals differ -> "false"
+          (no row can match, so callers skip the table entirely)
+        - otherwise -> "normal", with exact duplicate conditions removed
 
         Args:
-            table_name: Table in scope.
-            row: Row dict (includes _rid and columns).
+            table: Table in scope.
             where: WhereClause or None.
 
         Returns:
-            True if all conditions match.
-        """
-        if where is None:
-            return True
-        for cond in where.conditions:
-            if cond.op != "=":
-                raise ExecutionError("Only '=' is supported in WHERE")
-            col = self._resolve_col_single_table(table_name, cond.left, "WHERE")
-            if row.get(col) != cond.right:
-                return False
-        return True
+            (state, pairs) where state is "true", "false" or "normal" and pairs
+            are the normalized (column, literal) conditions.
+
+        Raises:
+            ExecutionError as for _prepare_where.
+        """
+        pairs = self._prepare_where(table, where)
+        if not pairs:
+            return "true", pairs
+
+        first: dict[str, Any] = {}
+        kept: list[tuple[str, Any]] = []
+        for col, val in pairs:
+            if col not in first:
+                first[col] = val
+                kept.append((col, val))
+                continue
+            prev = first[col]
+            if prev != val:
+                return "false", pairs
+            if type(prev) is not type(val):
+                kept.append((col, val))  # e.g. 1 vs true: equal under ==, keep both checks
+        return "normal", kept
+
+    @staticmethod
+    def _filter_single_table(
+        pairs: list[tuple[str, Any]],
+        rows: Iterable[dict[str, Any]],
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Stream the rows of a single table that satisfy prepared WHERE pairs.
+
+        The dominant OLTP shape, a single `col = literal`, is inlined into the
+        filtering generator (one dict lookup + one == per row, no call);
+        anything else goes through a compiled predicate.
+
+        Args:
+            pairs: (column, literal) pairs from _prepare_where/_analyze_where.
+            rows: Candidate row dicts.
+
+        Returns:
+            Iterator over matching rows, in input order. Callers that need the
+            rows more than once materialize it themselves.
+        """
+        if not pairs:
+            return iter(rows)
+        if len(pairs) == 1:
+            col, val = pairs[0]
+            return (r for r in rows if r[col] == val)
+        return filter(compile_equalities(pairs), rows)
 
     # --------------------------
     # constraint enforcement
     # --------------------------
 
+    def _unique_values(self, table: TableMeta) -> dict[str, set[Any]]:
+        """
+        Return the in-memory sets of existing PRIMARY KEY / UNIQUE values for a table.
+
+        The sets are built lazily with one heap scan the first time a table is
+        checked, then kept current by INSERT/UPDATE/DELETE (see
+        _track_unique_values), so constraint checks never rescan the table.
+
+        Args:
+            table: Table metadata.
+
+        Returns:
+            Dict of column name -> set of non-NULL values currently stored.
+        """
+        sets = self._unique_cache.get(table.name)
+        if sets is not None:
+            return sets
+
+        cols = [c.name for c in table.columns if c.primary_key or c.unique]
+        sets = {c: set() for c in cols}
+        if cols:
+            heap = self._open_heap(table.name)
+            for row in heap.scan_active():
+                for c in cols:
+                    v = row.get(c)
+                    if v is not None:
+                        sets[c].add(v)
+
+        self._unique_cache[table.name] = sets
+        return sets
+
+    def _track_unique_values(
+        self,
+        table: TableMeta,
+        removed: Iterable[dict[str, Any]] = (),
+        added: Iterable[dict[str, Any]] = (),
+    ) -> None:
+        """
+        Keep the cached PRIMARY KEY / UNIQUE value sets in sync after a write.
+
+        Args:
+            table: Table metadata.
+            removed: Rows that were deleted/replaced.
+            added: Rows that were stored.
+        """
+        sets = self._unique_cache.get(table.name)
+        if not sets:
+            return
+        for row in removed:
+            for c, vals in sets.items():
+                vals.discard(row.get(c))
+        for row in added:
+            for c, vals in sets.items():
+                v = row.get(c)
+                if v is not None:
+                    vals.add(v)
+
     def _enforce_constraints_batch(
         self,
         table: TableMeta,
-        existing_rows: list[dict[str, Any]],
         new_rows: list[dict[str, Any]],
-        exclude_rids: set[int],
+        old_rows: list[dict[str, Any]],
     ) -> None:
         """
         Enforce NOT NULL / PRIMARY KEY / UNIQUE constraints for a batch of new rows.
 
         This is used for:
-        - INSERT (new_rows length 1, exclude_rids empty)
-        - UPDATE (new_rows length N, exclude_rids are the old rids being replaced)
+        - INSERT (new_rows length 1, old_rows empty)
+        - UPDATE (new_rows length N, old_rows are the rows being replaced)
+
+        Uniqueness is checked against the cached value sets from _unique_values.
+        Because stored values are already unique, a value held by one of the
+        old_rows is free to be reused by the batch.
 
         Args:
             table: Table metadata.
-            existing_rows: Active rows currently in table (including _rid).
             new_rows: Candidate logical rows (no _rid required).
-            exclude_rids: Existing rids to ignore during conflict checks (rows being updated).
+            old_rows: Existing rows being replaced (UPDATE case).
 
         Raises:
             ConstraintError if a constraint is violated.
         """
-        # Existing rows excluding those we are replacing (UPDATE case)
-        existing_kept = [r for r in existing_rows if int(r.get("_rid")) not in exclude_rids]
+        pk_col = table.primary_key_column()
+        unique_cols = [c.name for c in table.columns if c.unique]
+        required = [(c.name, c.primary_key) for c in table.columns if c.not_null or c.primary_key]
 
         # NOT NULL + PK implies NOT NULL
         for nr in new_rows:
-            for c in table.columns:
-                if c.not_null or c.primary_key:
-                    if nr.get(c.name) is None:
-                        if c.primary_key:
-                            raise ConstraintError(f"PRIMARY KEY column cannot be NULL: {table.name}.{c.name}")
-                        raise ConstraintError(f"NOT NULL constraint failed: {table.name}.{c.name}")
+            for cname, is_pk in required:
+                if nr.get(cname) is None:
+                    if is_pk:
+                        raise ConstraintError(f"PRIMARY KEY column cannot be NULL: {table.name}.{cname}")
+                    raise ConstraintError(f"NOT NULL constraint failed: {table.name}.{cname}")
+
+        existing = self._unique_values(table)
+
+        # Values held by the replaced rows, for every constrained column, in one pass
+        freed: dict[str, set[Any]] = {c: set() for c in existing}
+        if old_rows:
+            freed_items = list(freed.items())
+            for r in old_rows:
+                for c, vals in freed_items:
+                    vals.add(r.get(c))
 
         # PRIMARY KEY uniqueness (single column)
-        pk_col = table.primary_key_column()
         if pk_col is not None:
-            existing_pks = {r.get(pk_col) for r in existing_kept}
+            existing_pks = existing[pk_col]
+            freed_pks = freed[pk_col]
             seen_new: set[Any] = set()
             for nr in new_rows:
                 pk_val = nr.get(pk_col)
-                if pk_val in existing_pks:
+                if pk_val in existing_pks and pk_val not in freed_pks:
                     raise ConstraintError(
                         f"PRIMARY KEY constraint failed: duplicate value {pk_val!r} for {table.name}.{pk_col}"
                     )
@@ -330,15 +489,15 @@ class Executor:
                 seen_new.add(pk_val)
 
         # UNIQUE uniqueness (NULLs ignored)
-        unique_cols = [c.name for c in table.columns if c.unique]
         for ucol in unique_cols:
-            existing_vals = {r.get(ucol) for r in existing_kept if r.get(ucol) is not None}
+            existing_vals = existing[ucol]
+            freed_vals = freed[ucol]
             seen_new_vals: set[Any] = set()
             for nr in new_rows:
                 v = nr.get(ucol)
                 if v is None:
                     continue
-                if v in existing_vals:
+                if v in existing_vals and v not in freed_vals:
                     raise ConstraintError(
                         f"UNIQUE constraint failed: duplicate value {v!r} for {table.name}.{ucol}"
                     )
@@ -355,70 +514,44 @@ class Executor:
     def _choose_index_candidates(
         self,
         table: TableMeta,
-        where,
+        pairs: list[tuple[str, Any]],
     ) -> tuple[str, list[int]] | None:
         """
         Attempt to choose an index to reduce candidates for WHERE.
 
         Strategy:
-        - For each condition of form col = literal, if there is an index on `col`,
-          compute candidate rid list from that index.
-        - Choose the smallest candidate list.
+        - For each prepared `col = literal` pair, if there is an index on `col`,
+          estimate its candidate count from the posting-list size (no list built).
+        - Pick the smallest estimate; on ties prefer the index with more distinct
+          keys (higher cardinality).
+        - Call lookup() once, on the chosen index only.
 
         Args:
             table: Table metadata.
-            where: WhereClause or None.
+            pairs: (column, literal) pairs from _prepare_where/_analyze_where.
 
         Returns:
             (index_name, candidate_rids) or None if no usable index.
         """
-        if where is None:
-            return None
+        best: tuple[int, int, HashIndex, Any] | None = None
 
-        best: tuple[str, list[int]] | None = None
-
-        for cond in where.conditions:
-            if cond.op != "=":
-                continue
-            # Ignore conditions qualified to some other table
-            if cond.left.table is not None and cond.left.table != table.name:
-                continue
-
-            col = cond.left.column
-            idx_meta = next((m for m in table.indexes.values() if m.column_name == col), None)
+        for col, val in pairs:
+            idx_meta = table.indexes_by_column.get(col)
             if idx_meta is None:
                 continue
 
             idx = self._open_index(idx_meta)
-            rids = idx.lookup(cond.right)
-
-            if best is None or len(rids) < len(best[1]):
-                best = (idx_meta.name, rids)
-
-        return best
-
-    def _fetch_rows_by_candidates(
-        self,
-        heap: HeapTable,
-        rids: list[int],
-    ) -> list[dict[str, Any]]:
-        """
-        Fetch rows for a candidate rid list using heap.get_by_rid.
-
-        Args:
-            heap: HeapTable.
-            rids: Candidate row ids.
-
-        Returns:
-            List of row dicts for those rids that still exist and are not deleted.
-        """
-        out: list[dict[str, Any]] = []
-        for rid in rids:
-            row = heap.get_by_rid(rid)
-            if row is None:
-                continue
-            out.append(row)
-        return out
+            size = idx.approx_size(val)
+            rank = (size, -idx.distinct_keys)
+            if best is None or rank < best[:2]:
+                best = (size, -idx.distinct_keys, idx, val)
+                if size == 0:
+                    break  # cannot do better than no candidates
+
+        if best is None:
+            return None
+        idx = best[2]
+        return idx.name, idx.lookup(best[3])
 
     # --------------------------
     # DML: INSERT
@@ -438,7 +571,7 @@ class Executor:
             CommandOk(rows_affected=1)
         """
         table = self.catalog.require_table(stmt.table_name)
-        heap = HeapTable.open(self.db_dir, stmt.table_name)
+        heap = self._open_heap(stmt.table_name)
 
         # Validate referenced columns
         cols_set = table.column_names()
@@ -446,23 +579,29 @@ class Executor:
             if c not in cols_set:
                 raise ExecutionError(f"Unknown column in INSERT: {stmt.table_name}.{c}")
 
-        # Build full row with all columns
+        # Build full row with all columns. Every heap row carries every schema
+        # column (UPDATE rewrites full rows too); predicate.py and join.py
+        # rely on this to subscript rows without a `.get` default.
         row: dict[str, Any] = {c.name: None for c in table.columns}
         for c, v in zip(stmt.columns, stmt.values):
             row[c] = v
 
         # Type + constraint checks
         self._validate_types(table, row)
-        existing = list(heap.scan_active())
-        self._enforce_constraints_batch(table, existing_rows=existing, new_rows=[row], exclude_rids=set())
+        self._enforce_constraints_batch(table, new_rows=[row], old_rows=[])
 
         # Write row and update indexes
-        rid = heap.insert(row)
+        try:
+            rid = heap.insert(row)
+        finally:
+            heap.flush()
+        self._track_unique_values(table, added=[row])
         indexes = self._table_indexes(table)
-        for idx in indexes:
-            idx.add(row.get(idx.column_name), rid)
-        for idx in indexes:
-            idx.save()
+        try:
+            for idx in indexes:
+                idx.add(row.get(idx.column_name), rid)
+        finally:
+            self._save_dirty_indexes(indexes)
 
         return CommandOk(rows_affected=1, message="1 row inserted")
 
@@ -479,7 +618,7 @@ class Executor:
             - scan plan
             - index plan if an indexed equality predicate exists
         - JOIN SELECT (INNER JOIN with equality):
-            - nested-loop or index nested-loop per join step
+            - hash join or index nested-loop per join step
 
         Returns:
             QueryResult(columns, rows, stats)
@@ -495,7 +634,7 @@ class Executor:
         Uses index if possible for WHERE equality predicates.
         """
         table = self.catalog.require_table(stmt.from_table)
-        heap = HeapTable.open(self.db_dir, stmt.from_table)
+        heap = self._open_heap(stmt.from_table)
 
         # Determine output columns
         if stmt.columns is None:
@@ -509,18 +648,21 @@ class Executor:
                     raise ExecutionError(f"Unknown column in SELECT: {stmt.from_table}.{col}")
                 out_cols.append(col)
 
+        state, pairs = self._analyze_where(table, stmt.where)
+        if state == "false":
+            return QueryResult(columns=out_cols, rows=[], stats={"plan": "empty"})
+
+        # Filter + projection fused into one generated comprehension
+        scan = compile_scan(pairs, out_cols)
+
         # Choose index plan if possible
-        chosen = self._choose_index_candidates(table, stmt.where)
-        rows_out: list[list[Any]] = []
+        chosen = self._choose_index_candidates(table, pairs)
 
         if chosen is not None:
             idx_name, rids = chosen
-            candidate_rows = self._fetch_rows_by_candidates(heap, rids)
+            candidate_rows = heap.get_by_rids(rids)
 
-            for row in candidate_rows:
-                if not self._row_matches_where_single_table(stmt.from_table, row, stmt.where):
-                    continue
-                rows_out.append([row.get(c) for c in out_cols])
+            rows_out = scan(candidate_rows)
 
             return QueryResult(
                 columns=out_cols,
@@ -529,10 +671,7 @@ class Executor:
             )
 
         # Fallback scan plan
-        for row in heap.scan_active():
-            if not self._row_matches_where_single_table(stmt.from_table, row, stmt.where):
-                continue
-            rows_out.append([row.get(c) for c in out_cols])
+        rows_out = scan(heap.scan_active())
 
         return QueryResult(columns=out_cols, rows=rows_out, stats={"plan": "scan"})
 
@@ -541,79 +680,71 @@ class Executor:
         Execute a SELECT with one or more JOIN clauses.
 
         Implementation:
-        - Seed intermediate combined rows from base table (qualified keys)
+        - Seed a columnar JoinBatch from the base table (qualified keys)
         - Apply join steps sequentially using join.inner_join()
-        - Apply WHERE on combined rows
-        - Project selected columns
+        - Apply each WHERE condition as soon as its table has been joined in
+        - Project selected columns by zipping column lists
 
         Notes:
         - For explicit SELECT columns in JOIN queries, columns MUST be qualified (table.column)
           to avoid ambiguity.
         """
         base_table = self.catalog.require_table(stmt.from_table)
-        base_heap = HeapTable.open(self.db_dir, stmt.from_table)
-
-        # Seed combined rows from base table
-        combined_rows: list[CombinedRow] = []
-        for r in base_heap.scan_active():
-            cr: CombinedRow = {}
-            for k, v in r.items():
-                if k == "_rid":
-                    continue
-                cr[(stmt.from_table, k)] = v
-            combined_rows.append(cr)
+        base_heap = self._open_heap(stmt.from_table)
 
-        plan_steps: list[dict[str, Any]] = []
+        # All (table, column) keys of the joined result, in schema order
+        all_keys = [(stmt.from_table, c.name) for c in base_table.columns]
         for j in stmt.joins:
-            combined_rows, step = inner_join(
+            all_keys += [(j.table_name, c.name) for c in self.catalog.require_table(j.table_name).columns]
+
+        # Resolve WHERE once against the full result, then push each condition
+        # down to the step that brings its table in: joins are inner equi-joins,
+        # so filtering early drops rows before they are probed or fanned out.
+        pushed: dict[str, list[tuple[tuple[str, str], Any]]] = {}
+        for key, val in resolve_batch_where(stmt.where, all_keys):
+            pushed.setdefault(key[0], []).append((key, val))
+
+        # Seed the columnar intermediate from the base table, filtering its
+        # rows with a compiled predicate before any column is gathered
+        base_rows = base_heap.scan_active()
+        base_where = [(c, v) for (_, c), v in pushed.pop(stmt.from_table, ())]
+        if base_where:
+            base_rows = list(filter(compile_equalities(base_where), base_rows))
+        batch = JoinBatch.from_rows(stmt.from_table, [c.name for c in base_table.columns], base_rows)
+
+        # Output projection (columns resolved before the joins)
+        if stmt.columns is None:
+            # SELECT * => all columns from base + join tables, qualified
+            out_keys = all_keys
+        else:
+            # Explicit column list => require qualification
+            out_keys = []
+            for c in stmt.columns:
+                if c.table is None:
+                    raise ExecutionError("In JOIN queries, qualify selected columns with table (e.g., users.id).")
+                out_keys.append((c.table, c.column))
+
+        # The last step only gathers the output columns: it is usually the
+        # widest intermediate, and unused columns would be copied per row.
+        last = len(stmt.joins) - 1
+        plan_steps: list[dict[str, Any]] = []
+        for n, j in enumerate(stmt.joins):
+            keep = set(out_keys) if n == last and stmt.columns is not None else None
+            batch, step = inner_join(
                 catalog=self.catalog,
                 db_dir=self.db_dir,
                 index_cache=self.index_cache,
-                left_rows=combined_rows,
+                heap_cache=self.heap_cache,
+                left=batch,
                 join=j,
+                where=[(c, v) for (_, c), v in pushed.pop(j.table_name, ())],
+                keep=keep,
             )
             plan_steps.append({"right_table": step.right_table, "method": step.method, "index": step.index_name})
 
-        # Apply WHERE after joins
-        combined_rows = [r for r in combined_rows if where_matches(r, stmt.where)]
-
-        # Output projection
-        if stmt.columns is None:
-            # SELECT * => all columns from base + join tables, qualified
-            out_cols: list[str] = []
-            out_cols += [f"{stmt.from_table}.{c.name}" for c in base_table.columns]
-
-            for j in stmt.joins:
-                t = self.catalog.require_table(j.table_name)
-                out_cols += [f"{j.table_name}.{c.name}" for c in t.columns]
-
-            rows_out: list[list[Any]] = []
-            for r in combined_rows:
-                vals: list[Any] = []
-                for qc in out_cols:
-                    tname, cname = qc.split(".", 1)
-                    vals.append(r.get((tname, cname)))
-                rows_out.append(vals)
-
-            return QueryResult(
-                columns=out_cols,
-                rows=rows_out,
-                stats={"plan": "join", "steps": plan_steps, "rows": len(rows_out)},
-            )
-
-        # Explicit column list => require qualification
-        out_cols = []
-        for c in stmt.columns:
-            if c.table is None:
-                raise ExecutionError("In JOIN queries, qualify selected columns with table (e.g., users.id).")
-            out_cols.append(f"{c.table}.{c.column}")
-
-        rows_out = []
-        for r in combined_rows:
-            rows_out.append([r.get((c.table, c.column)) for c in stmt.columns])  # type: ignore[union-attr]
-
+        rows_out = batch.rows(out_keys)
         return QueryResult(
-            columns=out_cols,
+            columns=[f"{t}.{c}" for t, c in out_keys],
             rows=rows_out,
             stats={"plan": "join", "steps": plan_steps, "rows": len(rows_out)},
         )
@@ -634,33 +765,43 @@ class Executor:
             CommandOk(rows_affected=N)
         """
         table = self.catalog.require_table(stmt.table_name)
-        heap = HeapTable.open(self.db_dir, stmt.table_name)
+        heap = self._open_heap(stmt.table_name)
         indexes = self._table_indexes(table)
 
+        state, pairs = self._analyze_where(table, stmt.where)
+        if state == "false":
+            return CommandOk(rows_affected=0, message="0 rows deleted")
+
         # Determine candidate rows using index if possible
-        chosen = self._choose_index_candidates(table, stmt.where)
+        chosen = self._choose_index_candidates(table, pairs)
         if chosen is not None:
             _, rids = chosen
-            candidates = self._fetch_rows_by_candidates(heap, rids)
+            candidates = heap.get_by_rids(rids)
         else:
-            candidates = list(heap.scan_active())
-
-        matched: list[dict[str, Any]] = []
-        for row in candidates:
-            if self._row_matches_where_single_table(stmt.table_name, row, stmt.where):
-                matched.append(row)
-
-        # Apply deletions
-        for row in matched:
-            rid = int(row["_rid"])
-            # Remove from indexes first (keeps index-backed queries correct)
-            for idx in indexes:
-                idx.remove(row.get(idx.column_name), rid)
-            # Tombstone storage (keeps scan-backed queries correct)
-            heap.tombstone(rid)
-
-        for idx in indexes:
-            idx.save()
+            candidates = heap.scan_active()
+
+        matched = list(self._filter_single_table(pairs, candidates))
+
+        # Apply deletions (bound methods hoisted out of the per-row loop)
+        tombstone = heap.tombstone
+        index_removes = [(idx.remove, idx.column_name) for idx in indexes]
+        try:
+            for row in matched:
+                rid = int(row["_rid"])
+                # Remove from indexes first (keeps index-backed queries correct)
+                for remove, col in index_removes:
+                    remove(row.get(col), rid)
+                # Tombstone storage (keeps scan-backed queries correct)
+                tombstone(rid)
+        except BaseException:
+            # Some rows may already be gone: rebuild the value sets on next use.
+            self._unique_cache.pop(table.name, None)
+            raise
+        finally:
+            heap.flush()
+            self._save_dirty_indexes(indexes)
+
+        self._track_unique_values(table, removed=matched)
 
         return CommandOk(rows_affected=len(matched), message=f"{len(matched)} rows deleted")
 
@@ -673,12 +814,12 @@ class Executor:
         UPDATE execution.
 
         Approach:
-        - Identify matching rows (index plan if possible)
-        - Build candidate new rows (full row dicts)
-        - Type check all candidate rows
+        - Identify matching rows (index plan if possible) and build candidate
+          new rows (full row dicts) in the same pass
+        - Type check the assigned values (once; stored values are already valid)
         - Enforce constraints in a batch (prevents partial updates)
         - Apply update as:
-            - insert(new_row) -> new_rid
+            - insert_many(new_rows) -> new_rids
             - tombstone(old_rid)
             - update indexes (remove old rid, add new rid)
 
@@ -686,7 +827,7 @@ class Executor:
             CommandOk(rows_affected=N)
         """
         table = self.catalog.require_table(stmt.table_name)
-        heap = HeapTable.open(self.db_dir, stmt.table_name)
+        heap = self._open_heap(stmt.table_name)
         indexes = self._table_indexes(table)
 
         table_cols = table.column_names()
@@ -696,62 +837,70 @@ class Executor:
             if a.column not in table_cols:
                 raise ExecutionError(f"Unknown column in UPDATE: {stmt.table_name}.{a.column}")
 
+        state, pairs = self._analyze_where(table, stmt.where)
+        if state == "false":
+            return CommandOk(rows_affected=0, message="0 rows updated")
+
         # Determine candidate rows using index if possible
-        chosen = self._choose_index_candidates(table, stmt.where)
+        chosen = self._choose_index_candidates(table, pairs)
         if chosen is not None:
             _, rids = chosen
-            candidates = self._fetch_rows_by_candidates(heap, rids)
+            candidates = heap.get_by_rids(rids)
         else:
-            candidates = list(heap.scan_active())
+            candidates = heap.scan_active()
 
-        # Filter to rows that match full WHERE
+        # One pass: filter by WHERE and build each replacement row alongside it.
+        # If a column is assigned twice, the last assignment wins.
+        assigned = {a.column: a.value for a in stmt.assignments}
         to_update: list[dict[str, Any]] = []
-        for row in candidates:
-            if self._row_matches_where_single_table(stmt.table_name, row, stmt.where):
-                to_update.append(row)
+        new_rows: list[dict[str, Any]] = []
+        for old in self._filter_single_table(pairs, candidates):
+            candidate = dict(old)
+            del candidate["_rid"]
+            candidate.update(assigned)
+            to_update.append(old)
+            new_rows.append(candidate)
 
         if not to_update:
             return CommandOk(rows_affected=0, message="0 rows updated")
 
-        # Build new candidate rows and collect exclude_rids
-        exclude_rids = {int(r["_rid"]) for r in to_update}
-        new_rows: list[dict[str, Any]] = []
-
-        for old in to_update:
-            # Start with old values for all schema columns
-            candidate: dict[str, Any] = {c.name: old.get(c.name) for c in table.columns}
+        # Stored values already passed type checks; only the assigned literals
+        # are new, and they are the same for every row, so check them once.
+        self._validate_types(table, assigned)
 
-            # Apply assignments
-            for a in stmt.assignments:
-                candidate[a.column] = a.value
-
-            # Validate types early (cheaper to fail before constraint checks)
-            self._validate_types(table, candidate)
-            new_rows.append(candidate)
-
-        # Constraint enforcement must consider existing active rows excluding old rids
-        existing_all = list(heap.scan_active())
-        self._enforce_constraints_batch(
-            table,
-            existing_rows=existing_all,
-            new_rows=new_rows,
-            exclude_rids=exclude_rids,
+        # Old rows already satisfy every constraint, so only assignments to
+        # NOT NULL / PRIMARY KEY / UNIQUE columns can introduce a violation.
+        # Otherwise skip the checks (and the value-set build they may trigger).
+        constrained = any(
+            c.name in assigned for c in table.columns if c.primary_key or c.unique or c.not_null
         )
-
-        # Apply updates
-        for old, candidate in zip(to_update, new_rows):
-            old_rid = int(old["_rid"])
-            new_rid = heap.insert(candidate)
-            heap.tombstone(old_rid)
-
-            # Maintain indexes (remove old rid from old value, add new rid for new value)
-            for idx in indexes:
-                old_val = old.get(idx.column_name)
-                new_val = candidate.get(idx.column_name)
-                idx.remove(old_val, old_rid)
-                idx.add(new_val, new_rid)
-
-        for idx in indexes:
-            idx.save()
+        if constrained:
+            # Constraint enforcement treats the old rows' values as free for reuse
+            self._enforce_constraints_batch(table, new_rows=new_rows, old_rows=to_update)
+
+        # Apply updates (bound methods hoisted out of the per-row loop).
+        # Replacement rows are appended in one batch, then old rows tombstoned.
+        tombstone = heap.tombstone
+        index_ops = [(idx.remove, idx.add, idx.column_name) for idx in indexes]
+        try:
+            new_rids = heap.insert_many(new_rows)
+            for old, candidate, new_rid in zip(to_update, new_rows, new_rids):
+                old_rid = int(old["_rid"])
+                tombstone(old_rid)
+
+                # Maintain indexes (remove old rid from old value, add new rid for new value)
+                for remove, add, col in index_ops:
+                    remove(old.get(col), old_rid)
+                    add(candidate.get(col), new_rid)
+        except BaseException:
+            # Some rows may already be replaced: rebuild the value sets on next use.
+            self._unique_cache.pop(table.name, None)
+            raise
+        finally:
+            heap.flush()
+            self._save_dirty_indexes(indexes)
+
+        if constrained:
+            self._track_unique_values(table, removed=to_update, added=new_rows)
 
         return CommandOk(rows_affected=len(to_update), message=f"{len(to_update)} rows updated")
\ No newline at end of file
@@ -0,0 +1,169 @@
+"""
+simpledb/exec/predicate.py
+
+WHERE-clause and projection compilation for the SimpleDB mini-RDBMS.
+
+Responsibilities:
+- Turn a WhereClause (AND of `col = literal`) into a single Python callable
+  `pred(row) -> bool` that can be applied per row without re-walking the AST.
+- Fuse a resolved WHERE and a SELECT column list into one generated scan
+  function `scan(rows) -> list[list]` (filter + projection in a single
+  comprehension, with no per-row Python call).
+
+Design notes:
+- The predicate *shape* (which row subscripts are compared) is turned into
+  Python source once and compiled with exec; the result is cached per shape.
+- Literal values are bound as closure variables rather than inlined into the
+  source, so the cache never confuses e.g. `a = 1` with `a = true`
+  (1 == True in Python) and arbitrary strings need no escaping.
+- Comparison semantics match the interpreted path: plain Python `==`.
+- Projection subscripts rows directly (heap rows are full rows; see
+  Executor._insert).
+- Column names appear in generated source only through repr(), so any
+  identifier the lexer accepts is safe to inline.
+- No NumPy/Numba kernel for integer equality scans: neither is a dependency,
+  rows live in dicts (so a column array would first have to be gathered per
+  scan, at the same cost as the generated comprehension), and a C-level
+  `compress(rows, map(eq, column, repeat(v)))` mask measured no faster than
+  the comprehension on 200k rows.
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import Any, Callable, Iterable, Mapping, Sequence
+
+from ..ast import WhereClause
+from ..errors import ExecutionError
+
+Predicate = Callable[[Any], bool]
+Scan = Callable[[Iterable[Any]], list[list[Any]]]
+
+
+def _always_true(row: Any) -> bool:
+    """Predicate used when there is no WHERE clause."""
+    return True
+
+
+@functools.lru_cache(maxsize=256)
+def _predicate_factory(keys: tuple[Any, ...]) -> Callable[..., Predicate]:
+    """
+    Build (and cache) a factory for predicates comparing `row[keys[i]] == v<i>`.
+
+    Args:
+        keys: Row subscripts, one per condition (ints, strings or tuples).
+
+    Returns:
+        A function taking one value per key and returning the bound predicate.
+    """
+    params = ", ".join(f"v{i}" for i in range(len(keys)))
+    body = " and ".join(f"row[{k!r}] == v{i}" for i, k in enumerate(keys))
+    src = f"def _make({params}):\n    return lambda row: {body}\n"
+    ns: dict[str, Any] = {}
+    exec(compile(src, "<simpledb-where>", "exec"), ns)
+    return ns["_make"]
+
+
+def compile_equalities(pairs: Sequence[tuple[Any, Any]]) -> Predicate:
+    """
+    Compile already-resolved `row[key] == value` checks into one predicate.
+
+    Args:
+        pairs: (row subscript, literal value) pairs, combined with AND.
+
+    Returns:
+        Callable taking a row and returning True if every pair matches.
+    """
+    if not pairs:
+        return _always_true
+    keys = tuple(k for k, _ in pairs)
+    return _predicate_factory(keys)(*(v for _, v in pairs))
+
+
+def resolve_where(where: WhereClause | None, col_index_map: Mapping[str, Any]) -> list[tuple[Any, Any]]:
+    """
+    Resolve a WHERE clause into (row subscript, literal value) pairs.
+
+    Args:
+        where: WhereClause or None.
+        col_index_map: Maps column name -> subscript used on a row: a position
+                       for tuple/list rows, or the key itself for dict rows.
+
+    Returns:
+        Pairs combined with AND (empty when there is no WHERE).
+
+    Raises:
+        ExecutionError: on unsupported operators or unknown columns.
+    """
+    if where is None:
+        return []
+
+    pairs: list[tuple[Any, Any]] = []
+    for cond in where.conditions:
+        if cond.op != "=":
+            raise ExecutionError("Only '=' is supported in WHERE")
+        key = col_index_map.get(cond.left.column)
+        if key is None:
+            raise ExecutionError(f"Unknown column in WHERE: {cond.left.column}")
+        pairs.append((key, cond.right))
+    return pairs
+
+
+def compile_where(where: WhereClause | None, col_index_map: Mapping[str, Any]) -> Predicate:
+    """
+    Compile a WHERE clause into a row predicate.
+
+    Args:
+        where: WhereClause or None.
+        col_index_map: Maps column name -> subscript used on a row: a position
+                       for tuple/list rows, or the key itself for dict rows.
+
+    Returns:
+        Callable taking a row and returning True if all conditions match.
+
+    Raises:
+        ExecutionError: on unsupported operators or unknown columns.
+    """
+    return compile_equalities(resolve_where(where, col_index_map))
+
+
+@functools.lru_cache(maxsize=256)
+def _scan_factory(pred_keys: tuple[Any, ...], out_keys: tuple[Any, ...]) -> Callable[..., Scan]:
+    """
+    Build (and cache) a factory for fused filter + projection scans.
+
+    The generated function is a single list comprehension:
+    `[[row[o0], ...] for row in rows if row[k0] == v0 and ...]`.
+
+    Args:
+        pred_keys: Row subscripts compared against v0..vN, combined with AND.
+        out_keys: Row subscripts of the output columns, in order.
+
+    Returns:
+        A function taking one value per predicate key and returning the scan.
+    """
+    params = ", ".join(f"v{i}" for i in range(len(pred_keys)))
+    item = "[" + ", ".join(f"row[{k!r}]" for k in out_keys) + "]"
+    cond = " and ".join(f"row[{k!r}] == v{i}" for i, k in enumerate(pred_keys))
+    body = f"[{item} for row in rows" + (f" if {cond}]" if cond else "]")
+    src = f"def _make({params}):\n    def scan(rows):\n        return {body}\n    return scan\n"
+    ns: dict[str, Any] = {}
+    exec(compile(src, "<simpledb-scan>", "exec"), ns)
+    return ns["_make"]
+
+
+def compile_scan(pairs: Sequence[tuple[Any, Any]], out_keys: Sequence[Any]) -> Scan:
+    """
+    Compile resolved WHERE pairs and output columns into one scan function.
+
+    Args:
+        pairs: (row subscript, literal value) pairs, combined with AND
+               (see resolve_where).
+        out_keys: Row subscripts of the output columns, in order.
+
+    Returns:
+        Callable taking an iterable of rows and returning the projected
+        values of the matching rows, in input order.
+    """
+    pred_keys = tuple(k for k, _ in pairs)
+    return _scan_factory(pred_keys, tuple(out_keys))(*(v for _, v in pairs))
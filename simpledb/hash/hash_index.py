@@ -3,27 +3,63 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 from ..errors import ExecutionError
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; stdlib json produces the same index layout.
+    orjson = None  # type: ignore[assignment]
 
-def encode_key(value: Any) -> str:
+IndexKey = tuple[str, Any]
+_TAGS: dict[type, str] = {int: "i", str: "s", bool: "b", type(None): "n"}
+
+
+def encode_key(value: Any) -> IndexKey:
     """
     Typed key encoding to avoid collisions:
-      int 1  -> "i:1"
-      str "1"-> "s:1"
-      bool True -> "b:true"
+      int 1  -> ("i", 1)
+      str "1"-> ("s", "1")
+      bool True -> ("b", True)
     """
-    if value is None:
+    tag = _TAGS.get(type(value))
+    if tag is None:
+        for base in (bool, int, str):
+            if isinstance(value, base):
+                tag = _TAGS[base]
+                break
+        else:
+            raise ExecutionError(f"Unsupported index key type: {type(value).__name__}")
+    return (tag, value)
+
+
+def key_to_text(key: IndexKey) -> str:
+    """On-disk form: "i:1", "s:1", "b:true", "n:null"."""
+    tag, value = key
+    if tag == "b":
+        return "b:true" if value else "b:false"
+    if tag == "n":
         return "n:null"
-    if isinstance(value, bool):
-        return f"b:{str(value).lower()}"
-    if isinstance(value, int) and not isinstance(value, bool):
-        return f"i:{value}"
-    if isinstance(value, str):
-        return f"s:{value}"
-    raise ExecutionError(f"Unsupported index key type: {type(value).__name__}")
+    return f"{tag}:{value}"
+
+
+def key_from_text(text: str) -> IndexKey:
+    tag, _, rest = text.partition(":")
+    if tag == "s":
+        return ("s", rest)
+    try:
+        if tag == "i":
+            return ("i", int(rest))
+    except ValueError:
+        pass
+    else:
+        if tag == "b":
+            return ("b", rest == "true")
+        if tag == "n":
+            return ("n", None)
+    raise ExecutionError(f"Corrupt index key: {text!r}")
 
 
 @dataclass
@@ -32,13 +68,14 @@ class HashIndex:
     table_name: str
     column_name: str
     path: Path
-    mapping: dict[str, set[int]]
+    mapping: dict[IndexKey, set[int]]
 
     @classmethod
     def open(cls, path: Path, *, name: str, table_name: str, column_name: str) -> "HashIndex":
         if path.exists():
-            raw = json.loads(path.read_text(encoding="utf-8"))
-            mp: dict[str, set[int]] = {k: set(v) for k, v in raw.get("mapping", {}).items()}
+            data = path.read_bytes()
+            raw = orjson.loads(data) if orjson is not None else json.loads(data)
+            mp: dict[IndexKey, set[int]] = {key_from_text(k): set(v) for k, v in raw.get("mapping", {}).items()}
             return cls(
                 name=raw.get("name", name),
                 table_name=raw.get("table_name", table_name),
@@ -48,15 +85,33 @@ class HashIndex:
             )
         return cls(name=name, table_name=table_name, column_name=column_name, path=path, mapping={})
 
-    def save(self) -> None:
+    def save(self, *, pretty: bool = False) -> None:
+        """
+        Persist this index to disk as JSON.
+
+        The default layout is compact and unsorted. pretty=True writes the
+        indented form with keys and rid lists sorted, for debugging and
+        stable diffs.
+
+        Args:
+            pretty: Write a human-friendly file instead of the compact one.
+        """
+        rids = sorted if pretty else list
         out = {
             "name": self.name,
             "table_name": self.table_name,
             "column_name": self.column_name,
-            "mapping": {k: sorted(list(v)) for k, v in self.mapping.items()},
+            "mapping": {key_to_text(k): rids(v) for k, v in self.mapping.items()},
         }
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.path.write_text(json.dumps(out, indent=2, sort_keys=True), encoding="utf-8")
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS if pretty else 0
+            payload = orjson.dumps(out, option=option)
+        elif pretty:
+            payload = json.dumps(out, indent=2, sort_keys=True).encode("utf-8")
+        else:
+            payload = json.dumps(out, separators=(",", ":")).encode("utf-8")
+        self.path.write_bytes(payload)
 
     def clear(self) -> None:
         self.mapping.clear()
@@ -82,4 +137,9 @@ class HashIndex:
         if value is None:
             return []
         k = encode_key(value)
-        return sorted(list(self.mapping.get(k, set())))
\ No newline at end of file
+        return sorted(self.mapping.get(k, ()))
+
+    def lookup_unsorted(self, value: Any) -> Iterable[int]:
+        if value is None:
+            return ()
+        return self.mapping.get(encode_key(value), ())
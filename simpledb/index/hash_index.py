@@ -4,55 +4,167 @@ simpledb/index/hash_index.py
 A simple persisted hash index for equality predicates.
 
 Responsibilities:
-- Maintain mapping: typed_key(value) -> set of row IDs (rids)
-- Persist index to JSON: <db_dir>/indexes/<index_name>.json
+- Maintain mapping: typed_key(value) -> sorted array of row IDs (rids)
+- Persist index to JSON: <db_dir>/indexes/<index_name>.json (snapshot)
+  plus an append-only change log: <db_dir>/indexes/<index_name>.json.log
 - Support basic operations:
     - add(value, rid)
     - remove(value, rid)
-    - lookup(value) -> list[rid]
+    - lookup(value) -> list[rid] (sorted); lookup_unsorted(value) for probes
+    - approx_size(value) / distinct_keys for cheap selectivity estimates
+- Track whether the in-memory mapping has unsaved changes (`dirty`)
 
 Design notes:
 - This index is intentionally simple and only supports equality lookups.
 - Key encoding includes type information to avoid collisions (e.g., int 1 vs str "1").
 - We do not index NULL values (consistent with many SQL systems' index behavior).
+- Rid buckets are sorted array('q') objects rather than sets: 8 bytes per rid
+  instead of a set slot plus an int object, which matters for low-cardinality
+  columns. Rids are allocated in increasing order, so add() is almost always
+  an append; out-of-order adds and removes use bisect. lookup() needs no sort.
+- Uses orjson when installed (faster open/save); falls back to stdlib json.
+  Both produce the same file layout.
+- Small changes are persisted by appending one line per add/remove to the log
+  ({"o": "+"|"-", "k": "i:5", "r": 12}) instead of rewriting the snapshot, so a
+  single-row INSERT costs O(1) index I/O. open() replays the log over the
+  snapshot; save() writes a fresh snapshot and drops the log (compaction),
+  which save_if_dirty() triggers once the log outgrows the index. Replaying
+  ops that the snapshot already contains is harmless (add/discard are
+  idempotent and applied in order), so a crash between the two steps of a
+  compaction loses nothing.
 """
 
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Mapping
 
 from ..errors import ExecutionError
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; stdlib json produces the same index layout.
+    orjson = None  # type: ignore[assignment]
 
-def encode_key(value: Any) -> str:
+# Compact once the log holds more ops than this or than the index has keys.
+LOG_COMPACT_MIN_OPS = 1024
+
+
+# Index keys are (type tag, value) tuples: dict hashing of a small tuple is a
+# single C call, and no string is formatted per add/remove/lookup. Exact-type
+# dispatch: type(True) is bool, so bools never share a tag with ints.
+IndexKey = tuple[str, Any]
+_TAGS: dict[type, str] = {int: "i", str: "s", bool: "b", type(None): "n"}
+
+
+def encode_key(value: Any) -> IndexKey:
     """
-    Encode a Python value into a stable, typed string key for index mapping.
+    Encode a Python value into a typed key for index mapping.
 
     Args:
         value: A literal value used in indexed columns (int, str, bool).
 
     Returns:
-        A typed string key such as:
-          - i:123
-          - s:hello
-          - b:true
+        A (tag, value) tuple such as ("i", 123), ("s", "hello"), ("b", True).
+        (NULL encodes as ("n", None); we don't index NULLs, but a key is harmless.)
 
     Raises:
         ExecutionError if the type is unsupported.
     """
-    if value is None:
-        # We don't index NULLs, but returning a key is harmless if needed.
+    tag = _TAGS.get(type(value))
+    if tag is None:
+        # Subclasses of the supported types (checked bool-first)
+        for base in (bool, int, str):
+            if isinstance(value, base):
+                tag = _TAGS[base]
+                break
+        else:
+            raise ExecutionError(f"Unsupported index key type: {type(value).__name__}")
+    return (tag, value)
+
+
+def key_to_text(key: IndexKey) -> str:
+    """
+    Render a typed key in its on-disk string form (i:123, s:hello, b:true, n:null).
+
+    Args:
+        key: (tag, value) key from encode_key.
+
+    Returns:
+        The string used as a JSON object key.
+    """
+    tag, value = key
+    if tag == "b":
+        return "b:true" if value else "b:false"
+    if tag == "n":
         return "n:null"
-    if isinstance(value, bool):
-        return f"b:{str(value).lower()}"
-    if isinstance(value, int) and not isinstance(value, bool):
-        return f"i:{value}"
-    if isinstance(value, str):
-        return f"s:{value}"
-    raise ExecutionError(f"Unsupported index key type: {type(value).__name__}")
+    return f"{tag}:{value}"
+
+
+def key_from_text(text: str) -> IndexKey:
+    """
+    Parse an on-disk key string back into a typed key.
+
+    Args:
+        text: String produced by key_to_text.
+
+    Returns:
+        (tag, value) key.
+
+    Raises:
+        ExecutionError on an unknown tag or malformed integer.
+    """
+    tag, _, rest = text.partition(":")
+    if tag == "s":
+        return ("s", rest)
+    try:
+        if tag == "i":
+            return ("i", int(rest))
+    except ValueError:
+        pass
+    else:
+        if tag == "b":
+            return ("b", rest == "true")
+        if tag == "n":
+            return ("n", None)
+    raise ExecutionError(f"Corrupt index key: {text!r}")
+
+
+def _bucket_add(mapping: dict[IndexKey, array], k: IndexKey, rid: int) -> None:
+    """Insert rid into the sorted bucket for k (no-op if already present)."""
+    arr = mapping.get(k)
+    if arr is None:
+        mapping[k] = array("q", (rid,))
+    elif not arr or arr[-1] < rid:
+        arr.append(rid)
+    else:
+        i = bisect_left(arr, rid)
+        if arr[i] != rid:
+            arr.insert(i, rid)
+
+
+def _bucket_discard(mapping: dict[IndexKey, array], k: IndexKey, rid: int) -> bool:
+    """
+    Remove rid from the bucket for k if present; drop the bucket when empty.
+
+    Returns:
+        True if the rid was removed, False if it was not in the bucket.
+    """
+    arr = mapping.get(k)
+    if arr is None:
+        return False
+    i = bisect_left(arr, rid)
+    if i < len(arr) and arr[i] == rid:
+        del arr[i]
+        if not arr:
+            del mapping[k]
+        return True
+    return False
 
 
 @dataclass
@@ -65,13 +177,22 @@ class HashIndex:
         table_name: Table name.
         column_name: Indexed column name.
         path: Path to JSON index file.
-        mapping: Dict of encoded keys -> set of rids.
+        mapping: Dict of typed (tag, value) keys -> sorted array('q') of rids; keys become
+                 "tag:value" strings only at the JSON boundary.
+        dirty: True when mapping has changed since it was opened or last saved.
+        _pending: Ops (+/-, key, rid) not yet appended to the log.
+        _log_ops: Number of ops currently in the on-disk log.
+        _needs_snapshot: True after clear()/bulk_load(), which the log cannot express.
     """
     name: str
     table_name: str
     column_name: str
     path: Path
-    mapping: dict[str, set[int]]
+    mapping: dict[IndexKey, array]
+    dirty: bool = field(default=False, compare=False)
+    _pending: list[tuple[str, IndexKey, int]] = field(default_factory=list, repr=False, compare=False)
+    _log_ops: int = field(default=0, repr=False, compare=False)
+    _needs_snapshot: bool = field(default=False, repr=False, compare=False)
 
     @classmethod
     def open(cls, path: Path, *, name: str, table_name: str, column_name: str) -> "HashIndex":
@@ -88,35 +209,152 @@ class HashIndex:
             HashIndex instance.
         """
         if path.exists():
-            raw = json.loads(path.read_text(encoding="utf-8"))
-            mp = {k: set(v) for k, v in raw.get("mapping", {}).items()}
-            return cls(
+            data = path.read_bytes()
+            raw = orjson.loads(data) if orjson is not None else json.loads(data)
+            mp = {key_from_text(k): array("q", sorted(v)) for k, v in raw.get("mapping", {}).items()}
+            idx = cls(
                 name=str(raw.get("name", name)),
                 table_name=str(raw.get("table_name", table_name)),
                 column_name=str(raw.get("column_name", column_name)),
                 path=path,
                 mapping=mp,
             )
-        return cls(name=name, table_name=table_name, column_name=column_name, path=path, mapping={})
+        else:
+            idx = cls(name=name, table_name=table_name, column_name=column_name, path=path, mapping={})
+        idx._replay_log()
+        return idx
 
-    def save(self) -> None:
+    @property
+    def log_path(self) -> Path:
+        """Path of the append-only change log next to the snapshot."""
+        return self.path.with_name(self.path.name + ".log")
+
+    def _replay_log(self) -> None:
+        """
+        Apply the on-disk change log (if any) on top of the loaded snapshot.
+
+        A torn final line (no trailing newline, e.g. after a crash mid-append)
+        is ignored.
+
+        Raises:
+            ExecutionError: on a corrupt log record.
+        """
+        log_path = self.log_path
+        if not log_path.exists():
+            return
+        lines = log_path.read_bytes().split(b"\n")
+        lines.pop()  # text after the last newline: b"" or a torn record
+        mapping = self.mapping
+        for line in lines:
+            if not line:
+                continue
+            try:
+                rec = orjson.loads(line) if orjson is not None else json.loads(line)
+                op, k, rid = rec["o"], key_from_text(rec["k"]), rec["r"]
+            except (ValueError, KeyError, TypeError) as e:
+                raise ExecutionError(f"Corrupt index log record in {log_path}: {e}") from e
+            if op == "+":
+                _bucket_add(mapping, k, rid)
+            else:
+                _bucket_discard(mapping, k, rid)
+            self._log_ops += 1
+
+    def save(self, *, pretty: bool = False) -> None:
         """
         Persist this index to disk as JSON.
 
-        The mapping is stored as key -> sorted list of rids for stable diffs.
+        The default layout is compact (no indentation, keys in mapping order):
+        formatting dominated save time for large indexes. pretty=True writes
+        the indented, key-sorted form for debugging and stable diffs. Rid
+        lists are sorted either way (buckets are kept sorted in memory).
+
+        Args:
+            pretty: Write a human-friendly file instead of the compact one.
         """
+        mapping = {key_to_text(k): v.tolist() for k, v in self.mapping.items()}
         out = {
             "name": self.name,
             "table_name": self.table_name,
             "column_name": self.column_name,
-            "mapping": {k: sorted(list(v)) for k, v in self.mapping.items()},
+            "mapping": mapping,
         }
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.path.write_text(json.dumps(out, indent=2, sort_keys=True), encoding="utf-8")
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS if pretty else 0
+            payload = orjson.dumps(out, option=option)
+        elif pretty:
+            payload = json.dumps(out, indent=2, sort_keys=True).encode("utf-8")
+        else:
+            payload = json.dumps(out, separators=(",", ":")).encode("utf-8")
+        self.path.write_bytes(payload)
+        # The snapshot now contains every logged op: drop the log.
+        self.log_path.unlink(missing_ok=True)
+        self._pending.clear()
+        self._log_ops = 0
+        self._needs_snapshot = False
+        self.dirty = False
+
+    def _append_log(self) -> None:
+        """Append pending ops to the change log (one compact JSON line each)."""
+        if orjson is not None:
+            lines = b"".join(
+                orjson.dumps({"o": op, "k": key_to_text(k), "r": rid}, option=orjson.OPT_APPEND_NEWLINE)
+                for op, k, rid in self._pending
+            )
+        else:
+            lines = "".join(
+                json.dumps({"o": op, "k": key_to_text(k), "r": rid}, separators=(",", ":")) + "\n"
+                for op, k, rid in self._pending
+            ).encode("utf-8")
+        with self.log_path.open("ab") as f:
+            f.write(lines)
+        self._log_ops += len(self._pending)
+        self._pending.clear()
+        self.dirty = False
+
+    def save_if_dirty(self) -> bool:
+        """
+        Persist this index only if it has unsaved changes.
+
+        Changes are appended to the log; a full snapshot is written instead
+        when there is none yet, after clear()/bulk_load(), or when the log
+        would outgrow max(LOG_COMPACT_MIN_OPS, number of keys).
+
+        Returns:
+            True if the index was written, False if it was already clean.
+        """
+        if not self.dirty:
+            return False
+        log_ops = self._log_ops + len(self._pending)
+        if self._needs_snapshot or log_ops > max(LOG_COMPACT_MIN_OPS, len(self.mapping)) or not self.path.exists():
+            self.save()
+        else:
+            self._append_log()
+        return True
 
     def clear(self) -> None:
         """Remove all entries from the index in memory (call save() to persist)."""
-        self.mapping.clear()
+        if self.mapping:
+            self.mapping.clear()
+            self._pending.clear()
+            self._needs_snapshot = True
+            self.dirty = True
+
+    def bulk_load(self, buckets: Mapping[Any, Iterable[int]]) -> None:
+        """
+        Replace the whole mapping from raw column values grouped to rids.
+
+        Used to build an index in one pass: keys are encoded once per distinct
+        value instead of once per row. Values must come from a single typed
+        column (so e.g. 1 and True never share a bucket); NULL is skipped.
+
+        Args:
+            buckets: Column value -> rids holding that value.
+        """
+        self.mapping = {encode_key(v): array("q", sorted(set(rids))) for v, rids in buckets.items() if v is not None}
+        self._pending.clear()
+        self._needs_snapshot = True
+        self.dirty = True
 
     def add(self, value: Any, rid: int) -> None:
         """
@@ -129,7 +367,10 @@ class HashIndex:
         if value is None:
             return
         k = encode_key(value)
-        self.mapping.setdefault(k, set()).add(int(rid))
+        rid = int(rid)
+        _bucket_add(self.mapping, k, rid)
+        self._pending.append(("+", k, rid))
+        self.dirty = True
 
     def remove(self, value: Any, rid: int) -> None:
         """
@@ -142,13 +383,11 @@ class HashIndex:
         if value is None:
             return
         k = encode_key(value)
-        s = self.mapping.get(k)
-        if not s:
+        rid = int(rid)
+        if not _bucket_discard(self.mapping, k, rid):  # drops emptied buckets
             return
-        s.discard(int(rid))
-        if not s:
-            # Keep mapping compact
-            self.mapping.pop(k, None)
+        self._pending.append(("-", k, rid))
+        self.dirty = True
 
     def lookup(self, value: Any) -> list[int]:
         """
@@ -163,5 +402,56 @@ class HashIndex:
         """
         if value is None:
             return []
-        k = encode_key(value)
-        return sorted(self.mapping.get(k, set()))
\ No newline at end of file
+        arr = self.mapping.get(encode_key(value))
+        return arr.tolist() if arr is not None else []
+
+    def lookup_unsorted(self, value: Any) -> Iterable[int]:
+        """
+        Lookup rids for a given column value, in no particular order.
+
+        For callers that only iterate the rids once (e.g. join probes): skips
+        the copy done by lookup(). (Buckets happen to be sorted, but callers
+        should not rely on it.)
+
+        Args:
+            value: Column value to lookup.
+
+        Returns:
+            The index's own rid array (treat as read-only), or an empty tuple.
+        """
+        if value is None:
+            return ()
+        return self.mapping.get(encode_key(value), ())
+
+    def lookup_many(self, values: Iterable[Any]) -> list[Iterable[int]]:
+        """
+        Lookup rids for many column values at once (see lookup_unsorted).
+
+        Args:
+            values: Column values to lookup.
+
+        Returns:
+            One read-only rid collection per value, in input order; NULL or
+            unmatched values map to an empty tuple.
+        """
+        get = self.mapping.get
+        return [() if v is None else get(encode_key(v), ()) for v in values]
+
+    def approx_size(self, value: Any) -> int:
+        """
+        Return how many rids `lookup(value)` would return, without building the list.
+
+        Args:
+            value: Column value.
+
+        Returns:
+            Posting-list length (0 for NULL or no match).
+        """
+        if value is None:
+            return 0
+        return len(self.mapping.get(encode_key(value), ()))
+
+    @property
+    def distinct_keys(self) -> int:
+        """Number of distinct non-NULL values currently indexed."""
+        return len(self.mapping)
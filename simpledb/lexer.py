@@ -18,8 +18,10 @@ Notes:
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from enum import Enum, auto
+from typing import Iterator
 
 from .errors import Position, SqlSyntaxError
 
@@ -90,7 +92,7 @@ KEYWORDS: dict[str, TokenType] = {
 }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Token:
     """
     A lexical token.
@@ -105,6 +107,9 @@ class Token:
                - BOOL -> bool
                - NULL -> None
         pos: Position in input (line/col)
+
+    Slotted like the AST nodes: tokenize() allocates one Token and one
+    Position per lexeme, so dropping the per-instance __dict__ matters.
     """
     typ: TokenType
     lexeme: str
@@ -112,141 +117,142 @@ class Token:
     pos: Position
 
 
-def tokenize(sql: str) -> list[Token]:
+# Single-character symbols
+_SYMBOL_TOK: dict[str, TokenType] = {
+    "(": TokenType.LPAREN,
+    ")": TokenType.RPAREN,
+    ",": TokenType.COMMA,
+    ";": TokenType.SEMI,
+    "=": TokenType.EQ,
+    "*": TokenType.STAR,
+    ".": TokenType.DOT,
+}
+
+# Reserved words -> (token type, token value), so classifying a word is one
+# dict lookup: keywords carry their upper-case text, TRUE/FALSE their bool,
+# NULL None (NULL is also in KEYWORDS; this entry gives it the None value).
+_WORD_TOK: dict[str, tuple[TokenType, object | None]] = {
+    **{kw: (typ, kw) for kw, typ in KEYWORDS.items()},
+    "TRUE": (TokenType.BOOL, True),
+    "FALSE": (TokenType.BOOL, False),
+    "NULL": (TokenType.NULL, None),
+}
+# Longer words cannot be reserved, so they skip the upper() copy and lookup.
+_WORD_MAX_LEN = max(map(len, _WORD_TOK))
+
+# One alternation, tried left to right at each position by the C regex engine.
+# Group numbers (m.lastindex) select the token kind:
+#   1 blanks without a newline, 2 whitespace starting with newline(s),
+#   3 symbol, 4 string literal, 5 integer, 6 identifier/keyword,
+#   7 anything else (an error: stray character or unterminated string).
+# Splitting whitespace in two means the common single-line gap is skipped
+# without extracting or scanning its text; only group 2 moves line/column.
+# \s, \d and \w are Unicode-aware, matching str.isspace/isdigit/isalnum closely
+# enough for SQL text; [^\W\d] is "a letter or underscore" (for ASCII exactly).
+# Character classification therefore happens inside the regex engine; no
+# per-character str.isalpha()/isdigit() calls or lookup tables are needed.
+_TOKEN_RE = re.compile(
+    r"([^\S\n]+)"
+    r"|(\n\s*)"
+    r"|([(),;=*.])"
+    r"|'([^']*)'"
+    r"|(\d+)"
+    r"|([^\W\d]\w*)"
+    r"|(.)",
+    re.DOTALL,
+)
+_BLANK, _NEWLINE, _SYM, _STR, _INT, _WORD = 1, 2, 3, 4, 5, 6
+
+# Token types built in the scan loop, as globals (cheaper than enum lookups)
+_STRING_T, _INT_T, _IDENT_T, _EOF_T = TokenType.STRING, TokenType.INT, TokenType.IDENT, TokenType.EOF
+
+
+def iter_tokens(sql: str) -> Iterator[Token]:
     """
-    Tokenize a SQL-like string into a list of Token objects.
+    Lazily tokenize a SQL-like string, one Token at a time.
+
+    The scan itself runs in the regex engine (see _TOKEN_RE); Python only
+    classifies each match and tracks line/column, which can change only
+    inside whitespace or string literals. Tokens are produced on demand, so a
+    consumer can process a long script without holding all of its tokens.
 
     Args:
         sql: Raw SQL input string.
 
-    Returns:
-        List of Token, always terminated with EOF token.
+    Yields:
+        Token objects, always ending with an EOF token.
 
     Raises:
-        SqlSyntaxError: for unexpected characters or unterminated strings.
+        SqlSyntaxError: for unexpected characters or unterminated strings
+            (raised when the scan reaches them).
     """
-    tokens: list[Token] = []
-    i = 0
     line = 1
-    col = 1
-
-    def cur_pos() -> Position:
-        return Position(line=line, col=col)
-
-    def peek(offset: int = 0) -> str:
-        j = i + offset
-        if j >= len(sql):
-            return ""
-        return sql[j]
-
-    def advance(n: int = 1) -> None:
-        """Advance the cursor by n characters while tracking line/column."""
-        nonlocal i, line, col
-        for _ in range(n):
-            if i >= len(sql):
-                return
-            ch = sql[i]
-            i += 1
-            if ch == "\n":
-                line += 1
-                col = 1
-            else:
-                col += 1
-
-    while i < len(sql):
-        ch = peek(0)
+    line_start = 0  # index of the first character of the current line
 
-        # Skip whitespace
-        if ch.isspace():
-            advance(1)
+    for m in _TOKEN_RE.finditer(sql):
+        kind = m.lastindex
+        if kind == _BLANK:
             continue
 
-        # Single-character symbols
-        if ch == "(":
-            tokens.append(Token(TokenType.LPAREN, ch, None, cur_pos()))
-            advance(1)
-            continue
-        if ch == ")":
-            tokens.append(Token(TokenType.RPAREN, ch, None, cur_pos()))
-            advance(1)
-            continue
-        if ch == ",":
-            tokens.append(Token(TokenType.COMMA, ch, None, cur_pos()))
-            advance(1)
-            continue
-        if ch == ";":
-            tokens.append(Token(TokenType.SEMI, ch, None, cur_pos()))
-            advance(1)
-            continue
-        if ch == "=":
-            tokens.append(Token(TokenType.EQ, ch, None, cur_pos()))
-            advance(1)
-            continue
-        if ch == "*":
-            tokens.append(Token(TokenType.STAR, ch, None, cur_pos()))
-            advance(1)
-            continue
-        if ch == ".":
-            tokens.append(Token(TokenType.DOT, ch, None, cur_pos()))
-            advance(1)
+        start = m.start()
+        if kind == _NEWLINE:
+            text = m.group(_NEWLINE)
+            line += text.count("\n")
+            line_start = start + text.rfind("\n") + 1
             continue
 
-        # String literal: '...'
-        if ch == "'":
-            start = cur_pos()
-            advance(1)  # consume opening quote
-            buf: list[str] = []
-            while True:
-                if i >= len(sql):
-                    raise SqlSyntaxError("Unterminated string literal", start)
-                c = peek(0)
-                if c == "'":
-                    advance(1)  # consume closing quote
-                    break
-                # Note: escaping not supported in this minimal lexer.
-                buf.append(c)
-                advance(1)
-            s = "".join(buf)
-            tokens.append(Token(TokenType.STRING, f"'{s}'", s, start))
-            continue
+        pos = Position(line, start - line_start + 1)
+
+        if kind == _SYM:
+            ch = m.group(_SYM)
+            yield Token(_SYMBOL_TOK[ch], ch, None, pos)
+
+        elif kind == _STR:
+            # Note: escaping not supported in this minimal lexer.
+            s = m.group(_STR)
+            yield Token(_STRING_T, f"'{s}'", s, pos)
+            if "\n" in s:
+                line += s.count("\n")
+                line_start = start + 1 + s.rfind("\n") + 1
+
+        elif kind == _INT:
+            lex = m.group(_INT)
+            yield Token(_INT_T, lex, int(lex), pos)
+
+        elif kind == _WORD:
+            # Identifier / keyword / boolean / NULL
+            lex = m.group(_WORD)
+            first = lex[0]
+            if first > "\x7f" and not first.isalpha():
+                # ASCII starts are always a letter or '_' here; beyond ASCII,
+                # \w also covers non-decimal numerics such as '²' or '½'.
+                raise SqlSyntaxError(f"Unexpected character: {first!r}", pos)
+            word = _WORD_TOK.get(lex.upper()) if len(lex) <= _WORD_MAX_LEN else None
+            if word is None:
+                yield Token(_IDENT_T, lex, lex, pos)
+            else:
+                yield Token(word[0], lex, word[1], pos)
 
-        # Integer literal
-        if ch.isdigit():
-            start = cur_pos()
-            j = i
-            while j < len(sql) and sql[j].isdigit():
-                j += 1
-            lex = sql[i:j]
-            tokens.append(Token(TokenType.INT, lex, int(lex), start))
-            advance(j - i)
-            continue
+        else:
+            ch = m.group()
+            if ch == "'":
+                raise SqlSyntaxError("Unterminated string literal", pos)
+            raise SqlSyntaxError(f"Unexpected character: {ch!r}", pos)
 
-        # Identifier / keyword / boolean / NULL
-        if ch.isalpha() or ch == "_":
-            start = cur_pos()
-            j = i
-            while j < len(sql) and (sql[j].isalnum() or sql[j] == "_"):
-                j += 1
-
-            lex = sql[i:j]
-            upper = lex.upper()
-
-            if upper == "TRUE":
-                tokens.append(Token(TokenType.BOOL, lex, True, start))
-            elif upper == "FALSE":
-                tokens.append(Token(TokenType.BOOL, lex, False, start))
-            elif upper == "NULL":
-                tokens.append(Token(TokenType.NULL, lex, None, start))
-            elif upper in KEYWORDS:
-                tokens.append(Token(KEYWORDS[upper], lex, upper, start))
-            else:
-                tokens.append(Token(TokenType.IDENT, lex, lex, start))
+    yield Token(_EOF_T, "", None, Position(line, len(sql) - line_start + 1))
 
-            advance(j - i)
-            continue
 
-        # Unknown character
-        raise SqlSyntaxError(f"Unexpected character: {ch!r}", cur_pos())
+def tokenize(sql: str) -> list[Token]:
+    """
+    Tokenize a SQL-like string into a list of Token objects.
 
-    tokens.append(Token(TokenType.EOF, "", None, Position(line=line, col=col)))
-    return tokens
+    Args:
+        sql: Raw SQL input string.
+
+    Returns:
+        List of Token, always terminated with EOF token.
+
+    Raises:
+        SqlSyntaxError: for unexpected characters or unterminated strings.
+    """
+    return list(iter_tokens(sql))
@@ -9,6 +9,7 @@ The engine returns one of:
 
 These are intentionally simple, serializable Python objects so they can be used
 by both the REPL and a demo web app without extra dependencies.
+They are frozen, slotted dataclasses (one is built per statement), like the AST nodes.
 """
 
 from __future__ import annotations
@@ -17,7 +18,7 @@ from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CommandOk:
     """
     Represents successful execution of a non-SELECT statement.
@@ -30,7 +31,7 @@ class CommandOk:
     message: str = "OK"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class QueryResult:
     """
     Represents the output of a SELECT query.
@@ -1,4 +1,5 @@
 import json
+from pathlib import Path
 
 import pytest
 
@@ -42,4 +43,74 @@ def test_duplicate_table_name_errors(tmp_path):
 def test_only_one_primary_key_supported(tmp_path):
     db = Database.open(tmp_path)
     with pytest.raises(ExecutionError):
-        db.execute("CREATE TABLE t (a INTEGER PRIMARY KEY, b INTEGER PRIMARY KEY);")
\ No newline at end of file
+        db.execute("CREATE TABLE t (a INTEGER PRIMARY KEY, b INTEGER PRIMARY KEY);")
+
+
+def test_catalog_reload_materializes_tables(tmp_path):
+    db = Database.open(tmp_path)
+    db.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, email VARCHAR(255));")
+    db.execute("CREATE INDEX idx_email ON users(email);")
+
+    raw = json.loads((tmp_path / "catalog.json").read_text(encoding="utf-8"))
+    assert "indexes" not in raw["tables"]["users"]
+    assert raw["indexes"]["idx_email"] == {"table_name": "users", "column_name": "email"}
+
+    Database.close(tmp_path)
+    db2 = Database.open(tmp_path)
+    assert db2 is not db
+    assert "users" in db2.catalog.tables
+    users = db2.catalog.require_table("users")
+    assert users.primary_key_column() == "id"
+    assert users.indexes["idx_email"] is db2.catalog.indexes["idx_email"]
+
+
+def test_clean_catalog_save_is_noop(tmp_path):
+    db = Database.open(tmp_path)
+    db.execute("CREATE TABLE t (id INTEGER PRIMARY KEY);")
+
+    catalog_path = tmp_path / "catalog.json"
+    catalog_path.write_text("sentinel", encoding="utf-8")
+
+    db.catalog.save(tmp_path)
+    assert catalog_path.read_text(encoding="utf-8") == "sentinel"
+
+    # Dirty but byte-identical to the last save: still skipped.
+    db.catalog.mark_dirty()
+    db.catalog.save(tmp_path)
+    assert catalog_path.read_text(encoding="utf-8") == "sentinel"
+
+    db.execute("CREATE TABLE u (id INTEGER PRIMARY KEY);")
+    assert set(json.loads(catalog_path.read_text(encoding="utf-8"))["tables"]) == {"t", "u"}
+
+
+def test_failed_catalog_write_is_retried(tmp_path, monkeypatch):
+    db = Database.open(tmp_path)
+    db.execute("CREATE TABLE a (id INTEGER PRIMARY KEY);")
+
+    def fail(self, data):
+        raise OSError("disk full")
+
+    with monkeypatch.context() as m:
+        m.setattr(Path, "write_bytes", fail)
+        with pytest.raises(OSError):
+            db.execute("CREATE TABLE b (id INTEGER PRIMARY KEY);")
+
+    db.catalog.save(tmp_path)
+    raw = json.loads((tmp_path / "catalog.json").read_text(encoding="utf-8"))
+    assert set(raw["tables"]) == {"a", "b"}
+
+
+def test_open_is_memoized_per_directory(tmp_path):
+    db = Database.open(tmp_path)
+    assert Database.open(str(tmp_path)) is db
+    Database.close(tmp_path)
+    assert Database.open(tmp_path) is not db
+
+
+def test_sorted_table_names_refresh_after_create(tmp_path):
+    db = Database.open(tmp_path)
+    db.execute("CREATE TABLE b (id INTEGER);")
+    db.execute("CREATE TABLE a (id INTEGER);")
+    assert db.catalog.sorted_table_names() == ["a", "b"]
+    db.execute("CREATE TABLE aa (id INTEGER);")
+    assert db.catalog.sorted_table_names() == ["a", "aa", "b"]
@@ -0,0 +1,103 @@
+import pytest
+
+from simpledb import Database
+from simpledb.errors import ConstraintError
+
+
+def test_primary_key_and_unique_duplicates_rejected(tmp_path):
+    db = Database.open(tmp_path)
+    db.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, email VARCHAR(255) UNIQUE NOT NULL);")
+    db.execute("INSERT INTO users (id, email) VALUES (1, 'a@b.com');")
+
+    with pytest.raises(ConstraintError):
+        db.execute("INSERT INTO users (id, email) VALUES (1, 'x@y.com');")
+    with pytest.raises(ConstraintError):
+        db.execute("INSERT INTO users (id, email) VALUES (2, 'a@b.com');")
+    with pytest.raises(ConstraintError):
+        db.execute("INSERT INTO users (id) VALUES (3);")
+
+
+def test_values_freed_by_delete_and_update_can_be_reused(tmp_path):
+    db = Database.open(tmp_path)
+    db.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, email VARCHAR(255) UNIQUE);")
+    db.execute("INSERT INTO users (id, email) VALUES (1, 'a@b.com');")
+    db.execute("INSERT INTO users (id, email) VALUES (2, 'c@d.com');")
+
+    # Re-assigning a row its own value is not a conflict.
+    db.execute("UPDATE users SET email = 'a@b.com' WHERE id = 1;")
+    with pytest.raises(ConstraintError):
+        db.execute("UPDATE users SET email = 'c@d.com' WHERE id = 1;")
+
+    db.execute("UPDATE users SET email = 'z@z.com' WHERE id = 2;")
+    db.execute("INSERT INTO users (id, email) VALUES (3, 'c@d.com');")
+
+    db.execute("DELETE FROM users WHERE id = 1;")
+    db.execute("INSERT INTO users (id, email) VALUES (1, 'a@b.com');")
+
+    res = db.execute("SELECT id, email FROM users;")
+    assert sorted(res.rows) == [[1, "a@b.com"], [2, "z@z.com"], [3, "c@d.com"]]
+
+
+def test_unique_values_survive_reopen(tmp_path):
+    db = Database.open(tmp_path)
+    db.execute("CREATE TABLE t (id INTEGER PRIMARY KEY);")
+    db.execute("INSERT INTO t (id) VALUES (1);")
+
+    Database.close(tmp_path)
+    db = Database.open(tmp_path)
+    with pytest.raises(ConstraintError):
+        db.execute("INSERT INTO t (id) VALUES (1);")
+
+
+def test_close_releases_cached_heaps(tmp_path):
+    db = Database.open(tmp_path)
+    db.execute("CREATE TABLE t (id INTEGER PRIMARY KEY);")
+    db.execute("INSERT INTO t (id) VALUES (1);")
+    heap = db.executor.heap_cache["t"]
+    assert heap._append_fh is not None
+
+    Database.close(tmp_path)
+    assert heap._append_fh is None and heap._read_fd is None
+    assert db.executor.heap_cache == {}
+    assert Database.open(tmp_path) is not db
+
+
+def test_update_of_unconstrained_column_skips_constraint_checks(tmp_path):
+    db = Database.open(tmp_path)
+    db.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, email VARCHAR(255) UNIQUE, age INTEGER);")
+    db.execute("INSERT INTO users (id, email, age) VALUES (1, 'a@b.com', 30);")
+    db.executor._unique_cache.clear()
+
+    assert db.execute("UPDATE users SET age = 31 WHERE id = 1;").rows_affected == 1
+    assert "users" not in db.executor._unique_cache
+
+    db.execute("INSERT INTO users (id, email) VALUES (2, 'c@d.com');")
+    with pytest.raises(ConstraintError):
+        db.execute("UPDATE users SET email = 'a@b.com' WHERE id = 2;")
+
+
+def test_failed_delete_drops_unique_cache(tmp_path, monkeypatch):
+    db = Database.open(tmp_path)
+    db.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, g INTEGER);")
+    db.execute("INSERT INTO t (id, g) VALUES (1, 0);")
+    db.execute("INSERT INTO t (id, g) VALUES (2, 0);")
+    heap = db.executor.heap_cache["t"]
+    tombstone = heap.tombstone
+    calls = []
+
+    def flaky(rid):
+        calls.append(rid)
+        if len(calls) == 2:
+            raise OSError("disk full")
+        tombstone(rid)
+
+    monkeypatch.setattr(heap, "tombstone", flaky)
+    with pytest.raises(OSError):
+        db.execute("DELETE FROM t WHERE g = 0;")
+    monkeypatch.undo()
+
+    assert "t" not in db.executor._unique_cache
+    survivor = db.execute("SELECT id FROM t;").rows[0][0]
+    with pytest.raises(ConstraintError):
+        db.execute(f"INSERT INTO t (id) VALUES ({survivor});")
+    db.execute(f"INSERT INTO t (id) VALUES ({3 - survivor});")
@@ -15,4 +15,19 @@ def test_index_backed_select(tmp_path):
     assert res.rows == [[2]]
     assert res.stats is not None
     assert res.stats["plan"] == "index"
-    assert res.stats["index"] == "idx_email"
\ No newline at end of file
+    assert res.stats["index"] == "idx_email"
+
+def test_removing_absent_rid_leaves_index_clean(tmp_path):
+    from simpledb.index.hash_index import HashIndex
+
+    idx = HashIndex.open(tmp_path / "i.json", name="i", table_name="t", column_name="c")
+    idx.add("a", 1)
+    idx.save()
+
+    idx.remove("a", 2)
+    idx.remove("b", 1)
+    assert not idx.dirty and not idx._pending
+    assert idx.lookup("a") == [1]
+
+    idx.remove("a", 1)
+    assert idx.dirty and idx.lookup("a") == []
@@ -1,4 +1,7 @@
+import pytest
+
 from simpledb import Database
+from simpledb.errors import ExecutionError
 from simpledb.result import QueryResult
 
 
@@ -29,4 +32,74 @@ def test_join_transactions_categories(tmp_path):
         [101, "Rent"],
     ]
     assert res.stats is not None
-    assert res.stats["plan"] == "join"
\ No newline at end of file
+    assert res.stats["plan"] == "join"
+
+
+def test_join_where_unqualified_and_ambiguous(tmp_path):
+    db = Database.open(tmp_path)
+    db.execute("CREATE TABLE a (id INTEGER, x INTEGER);")
+    db.execute("CREATE TABLE b (id INTEGER, a_id INTEGER, y INTEGER);")
+    db.execute("INSERT INTO a (id, x) VALUES (1, 5);")
+    db.execute("INSERT INTO a (id, x) VALUES (2, 6);")
+    db.execute("INSERT INTO b (id, a_id, y) VALUES (10, 1, 7);")
+    db.execute("INSERT INTO b (id, a_id, y) VALUES (11, 2, 8);")
+
+    res = db.execute("SELECT a.id, b.id FROM a JOIN b ON a.id = b.a_id WHERE y = 8;")
+    assert res.rows == [[2, 11]]
+
+    with pytest.raises(ExecutionError):
+        db.execute("SELECT * FROM a JOIN b ON a.id = b.a_id WHERE id = 1;")
+
+
+def test_join_fan_out_across_two_steps(tmp_path):
+    db = Database.open(tmp_path)
+    db.execute("CREATE TABLE a (id INTEGER);")
+    db.execute("CREATE TABLE b (a_id INTEGER, tag VARCHAR(5));")
+    db.execute("CREATE TABLE c (tag VARCHAR(5), n INTEGER);")
+    db.execute("INSERT INTO a (id) VALUES (1);")
+    db.execute("INSERT INTO a (id) VALUES (2);")
+    db.execute("INSERT INTO b (a_id, tag) VALUES (1, 'x');")
+    db.execute("INSERT INTO b (a_id, tag) VALUES (1, 'y');")
+    db.execute("INSERT INTO c (tag, n) VALUES ('x', 3);")
+    db.execute("INSERT INTO c (tag, n) VALUES ('y', 4);")
+    db.execute("INSERT INTO c (tag, n) VALUES ('y', 5);")
+    db.execute("CREATE INDEX idx_c_tag ON c(tag);")
+
+    res = db.execute("SELECT * FROM a JOIN b ON a.id = b.a_id JOIN c ON b.tag = c.tag;")
+    assert res.columns == ["a.id", "b.a_id", "b.tag", "c.tag", "c.n"]
+    assert sorted(res.rows) == [[1, 1, "x", "x", 3], [1, 1, "y", "y", 4], [1, 1, "y", "y", 5]]
+    assert [s["method"] for s in res.stats["steps"]] == ["hash", "index"]
+
+    res = db.execute("SELECT c.n FROM a JOIN b ON a.id = b.a_id JOIN c ON b.tag = c.tag WHERE c.tag = 'y' AND n = 5;")
+    assert res.rows == [[5]]
+
+
+def test_hash_join_never_matches_null_keys(tmp_path):
+    db = Database.open(tmp_path)
+    db.execute("CREATE TABLE a (id INTEGER, k INTEGER);")
+    db.execute("CREATE TABLE b (k INTEGER, v INTEGER);")
+    db.execute("INSERT INTO a (id) VALUES (1);")
+    db.execute("INSERT INTO a (id, k) VALUES (2, 7);")
+    db.execute("INSERT INTO b (v) VALUES (10);")
+    db.execute("INSERT INTO b (k, v) VALUES (7, 20);")
+
+    res = db.execute("SELECT a.id, b.v FROM a JOIN b ON a.k = b.k;")
+    assert res.rows == [[2, 20]]
+    assert res.stats["steps"][0]["method"] == "hash"
+
+
+def test_join_where_is_pushed_down_per_table(tmp_path):
+    db = Database.open(tmp_path)
+    db.execute("CREATE TABLE a (id INTEGER, x INTEGER);")
+    db.execute("CREATE TABLE b (a_id INTEGER, y INTEGER);")
+    for i in range(1, 5):
+        db.execute(f"INSERT INTO a (id, x) VALUES ({i}, {i % 2});")
+        db.execute(f"INSERT INTO b (a_id, y) VALUES ({i}, {i});")
+        db.execute(f"INSERT INTO b (a_id, y) VALUES ({i}, {i * 10});")
+
+    res = db.execute("SELECT a.id, b.y FROM a JOIN b ON a.id = b.a_id WHERE a.x = 1 AND y = 30;")
+    assert res.rows == [[3, 30]]
+
+    # Column errors still surface when the base filter leaves no rows
+    with pytest.raises(ExecutionError):
+        db.execute("SELECT * FROM a JOIN b ON a.id = b.a_id WHERE a.x = 9 AND b.nope = 1;")
@@ -38,4 +38,19 @@ def test_tokenize_select_join_where_and():
 
 def test_unterminated_string_raises():
     with pytest.raises(SqlSyntaxError):
-        tokenize("INSERT INTO t (name) VALUES ('oops);")
\ No newline at end of file
+        tokenize("INSERT INTO t (name) VALUES ('oops);")
+
+
+def test_token_positions_across_lines_and_strings():
+    tokens = tokenize("SELECT a\n  FROM t WHERE s = 'x\ny' AND\tb = 1;")
+    pos = {t.lexeme: (t.pos.line, t.pos.col) for t in tokens}
+    assert pos["SELECT"] == (1, 1)
+    assert pos["FROM"] == (2, 3)
+    assert pos["'x\ny'"] == (2, 20)
+    assert pos["AND"] == (3, 4)
+    assert pos["b"] == (3, 8)
+    assert (tokens[-1].pos.line, tokens[-1].pos.col) == (3, 14)
+
+    with pytest.raises(SqlSyntaxError) as exc:
+        tokenize("SELECT\n  a ? b;")
+    assert (exc.value.position.line, exc.value.position.col) == (2, 5)
@@ -142,4 +142,19 @@ def test_parse_delete():
 
 def test_parse_errors_on_missing_paren():
     with pytest.raises(SqlSyntaxError):
-        parse_sql("CREATE TABLE t (id INTEGER;")
\ No newline at end of file
+        parse_sql("CREATE TABLE t (id INTEGER;")
+
+
+def test_parse_large_script_statement_by_statement():
+    from simpledb.parser import _SCRIPT_CACHE_MAX_CHARS, parse_script
+
+    stmt = "INSERT INTO users (id, email) VALUES (1, 'a;b');\n"
+    sql = stmt * (_SCRIPT_CACHE_MAX_CHARS // len(stmt) + 1) + ";; SELECT * FROM users"
+    stmts = parse_script(sql)
+    assert len(stmts) == _SCRIPT_CACHE_MAX_CHARS // len(stmt) + 2
+    assert stmts[0].values == [1, "a;b"]
+    assert isinstance(stmts[-1], Select)
+
+    with pytest.raises(SqlSyntaxError) as e:
+        parse_script(sql + "; SELECT FROM users;")
+    assert "Expected" in str(e.value)
@@ -0,0 +1,39 @@
+import pytest
+
+from simpledb.ast import ColumnRef, Condition, WhereClause
+from simpledb.errors import ExecutionError
+from simpledb.exec.predicate import compile_scan, compile_where, resolve_where
+
+
+def _where(*pairs):
+    return WhereClause(conditions=[Condition(left=ColumnRef(column=c), op="=", right=v) for c, v in pairs])
+
+
+def test_compile_where_tuple_rows():
+    pred = compile_where(_where(("a", 1), ("name", "x")), {"a": 0, "name": 2})
+    assert pred((1, None, "x")) is True
+    assert pred((1, None, "y")) is False
+    assert pred((2, None, "x")) is False
+
+
+def test_compile_where_dict_rows_and_none():
+    assert compile_where(None, {})({"a": 1}) is True
+    pred = compile_where(_where(("a", "it's")), {"a": "a"})
+    assert pred({"a": "it's"}) is True
+    assert pred({"a": "its"}) is False
+
+
+def test_compile_where_unknown_column_errors():
+    with pytest.raises(ExecutionError):
+        compile_where(_where(("nope", 1)), {"a": 0})
+
+
+def test_compile_scan_filters_and_projects():
+    rows = [{"a": 1, "b": "x", "c": None}, {"a": 2, "b": "y", "c": True}, {"a": 1, "b": "z", "c": 1}]
+    scan = compile_scan(resolve_where(_where(("a", 1)), {"a": "a"}), ["c", "b"])
+    assert scan(rows) == [[None, "x"], [1, "z"]]
+    assert compile_scan([], ["b"])(rows) == [["x"], ["y"], ["z"]]
+    # Same shape, different literals: values are bound, not cached with the shape
+    assert compile_scan([("b", "y")], ["a"])(rows) == [[2]]
+    assert compile_scan([("b", "z")], ["a"])(rows) == [[1]]
+    assert compile_scan([("c", None)], [])(rows) == [[]]
@@ -0,0 +1,380 @@
+import pytest
+
+from simpledb import Database
+from simpledb.errors import ExecutionError
+from simpledb.result import QueryResult
+from simpledb.index.hash_index import HashIndex
+from simpledb.storage.heap import HeapTable
+from simpledb.storage.rid_directory import RidDirectory
+
+
+def test_insert_and_select_star(tmp_path):
+    db = Database.open(tmp_path)
+    db.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, email VARCHAR(255));")
+
+    db.execute("INSERT INTO users (id, email) VALUES (1, 'a@b.com');")
+    db.execute("INSERT INTO users (id, email) VALUES (2, 'c@d.com');")
+
+    res = db.execute("SELECT * FROM users;")
+    assert isinstance(res, QueryResult)
+    assert res.columns == ["id", "email"]
+    assert res.rows == [
+        [1, "a@b.com"],
+        [2, "c@d.com"],
+    ]
+
+
+def test_select_where_and(tmp_path):
+    db = Database.open(tmp_path)
+    db.execute("CREATE TABLE t (a INTEGER, b BOOLEAN, name VARCHAR(10));")
+
+    db.execute("INSERT INTO t (a, b, name) VALUES (1, true, 'x');")
+    db.execute("INSERT INTO t (a, b, name) VALUES (1, false, 'y');")
+    db.execute("INSERT INTO t (a, b, name) VALUES (2, true, 'z');")
+
+    res = db.execute("SELECT name FROM t WHERE a = 1 AND b = true;")
+    assert res.columns == ["name"]
+    assert res.rows == [["x"]]
+
+
+def test_insert_unknown_column_errors(tmp_path):
+    db = Database.open(tmp_path)
+    db.execute("CREATE TABLE users (id INTEGER, email VARCHAR(255));")
+    with pytest.raises(ExecutionError):
+        db.execute("INSERT INTO users (id, nope) VALUES (1, 'x');")
+
+
+def test_select_unknown_column_errors(tmp_path):
+    db = Database.open(tmp_path)
+    db.execute("CREATE TABLE users (id INTEGER, email VARCHAR(255));")
+    with pytest.raises(ExecutionError):
+        db.execute("SELECT nope FROM users;")
+
+
+def test_basic_type_validation_integer(tmp_path):
+    db = Database.open(tmp_path)
+    db.execute("CREATE TABLE t (a INTEGER);")
+    with pytest.raises(ExecutionError):
+        db.execute("INSERT INTO t (a) VALUES ('not-int');")
+
+
+def test_heap_row_cache_tracks_mutations(tmp_path):
+    heap = HeapTable.open(tmp_path, "t")
+    r1 = heap.insert({"a": 1})
+    r2 = heap.insert({"a": 2})
+
+    first = heap.scan_active()
+    assert [r["a"] for r in first] == [1, 2]
+    assert heap.scan_active() is first  # unchanged heap -> same snapshot
+
+    heap.tombstone(r1)
+    r3 = heap.insert({"a": 3})
+    heap.flush()
+    assert [r["a"] for r in heap.scan_active()] == [2, 3]
+    assert heap.get_by_rid(r1) is None
+    assert heap.get_by_rid(r3)["a"] == 3
+
+    # A fresh handle reading from disk agrees with the cached one.
+    fresh = HeapTable.open(tmp_path, "t")
+    assert [r["_rid"] for r in fresh.scan_active()] == [r2, r3]
+
+
+def test_where_unknown_column_errors(tmp_path):
+    db = Database.open(tmp_path)
+    db.execute("CREATE TABLE t (a INTEGER);")
+    db.execute("INSERT INTO t (a) VALUES (1);")
+    with pytest.raises(ExecutionError):
+        db.execute("SELECT a FROM t WHERE nope = 1;")
+    with pytest.raises(ExecutionError):
+        db.execute("DELETE FROM t WHERE nope = 1;")
+
+
+def test_index_saved_only_when_dirty(tmp_path):
+    idx = HashIndex.open(tmp_path / "i.json", name="i", table_name="t", column_name="c")
+    idx.add(None, 1)
+    assert idx.save_if_dirty() is False
+    assert not (tmp_path / "i.json").exists()
+
+    idx.add(5, 1)
+    assert idx.dirty
+    assert idx.save_if_dirty() is True
+    assert not idx.dirty
+
+    db = Database.open(tmp_path / "db")
+    db.execute("CREATE TABLE t (id INTEGER, v INTEGER);")
+    db.execute("INSERT INTO t (id, v) VALUES (1, 2);")
+    db.execute("CREATE INDEX idx_v ON t(v);")
+    path = tmp_path / "db" / "indexes" / "idx_v.json"
+    path.unlink()
+    db.execute("DELETE FROM t WHERE id = 99;")
+    db.execute("INSERT INTO t (id) VALUES (2);")
+    assert not path.exists()
+    db.execute("UPDATE t SET v = 3 WHERE id = 1;")
+    assert path.exists()
+
+
+def test_heap_round_trips_integers_beyond_64_bits(tmp_path):
+    db = Database.open(tmp_path)
+    db.execute("CREATE TABLE t (id INTEGER, v INTEGER);")
+    db.execute(f"INSERT INTO t (id, v) VALUES (1, {2 ** 70});")
+    db.execute("INSERT INTO t (id, v) VALUES (2, 3);")
+
+    rows = HeapTable.open(tmp_path, "t").scan_active()
+    assert [(r["id"], r["v"]) for r in rows] == [(1, 2 ** 70), (2, 3)]
+
+
+def test_heap_get_by_rids_preserves_order_and_skips_deleted(tmp_path):
+    heap = HeapTable.open(tmp_path, "t")
+    rids = [heap.insert({"v": i}) for i in range(5)]
+    heap.tombstone(rids[2])
+    heap.flush()
+
+    fresh = HeapTable.open(tmp_path, "t")  # no row cache: reads the file
+    got = fresh.get_by_rids([rids[4], rids[2], rids[0], 999, rids[4]])
+    assert [r["v"] for r in got] == [4, 0, 4]
+
+    fresh.scan_active()  # cached path gives the same answer
+    assert fresh.get_by_rids([rids[4], rids[2], rids[0], 999, rids[4]]) == got
+
+
+def test_contradictory_where_skips_table(tmp_path):
+    db = Database.open(tmp_path)
+    db.execute("CREATE TABLE t (a INTEGER, b INTEGER);")
+    db.execute("INSERT INTO t (a, b) VALUES (1, 2);")
+
+    res = db.execute("SELECT * FROM t WHERE a = 1 AND a = 2;")
+    assert res.rows == [] and res.stats["plan"] == "empty"
+    assert db.execute("SELECT b FROM t WHERE a = 1 AND t.a = 1;").rows == [[2]]
+    assert db.execute("DELETE FROM t WHERE a = 1 AND a = 3;").rows_affected == 0
+    assert db.execute("UPDATE t SET b = 5 WHERE b = 2 AND b = 'x';").rows_affected == 0
+
+    with pytest.raises(ExecutionError):
+        db.execute("SELECT * FROM t WHERE a = 1 AND a = 2 AND nope = 3;")
+
+
+def test_index_plan_picks_smallest_posting_list(tmp_path):
+    db = Database.open(tmp_path)
+    db.execute("CREATE TABLE t (id INTEGER, kind VARCHAR(5));")
+    for i in range(6):
+        db.execute(f"INSERT INTO t (id, kind) VALUES ({i}, 'k');")
+    db.execute("CREATE INDEX idx_kind ON t(kind);")
+    db.execute("CREATE INDEX idx_id ON t(id);")
+
+    res = db.execute("SELECT id FROM t WHERE kind = 'k' AND id = 3;")
+    assert res.rows == [[3]]
+    assert res.stats == {"plan": "index", "index": "idx_id", "candidates": 1}
+
+
+def test_index_typed_keys_round_trip_through_disk(tmp_path):
+    path = tmp_path / "i.json"
+    idx = HashIndex.open(path, name="i", table_name="t", column_name="c")
+    for rid, value in enumerate([1, True, "1", "a:b", 2 ** 70], start=1):
+        idx.add(value, rid)
+    idx.save()
+
+    again = HashIndex.open(path, name="i", table_name="t", column_name="c")
+    assert again.mapping == idx.mapping
+    assert again.lookup(1) == [1] and again.lookup(True) == [2] and again.lookup("1") == [3]
+    assert again.lookup("a:b") == [4] and again.lookup(2 ** 70) == [5]
+    assert [sorted(r) for r in again.lookup_many([True, None, "zz", 1])] == [[2], [], [], [1]]
+
+
+def test_index_small_changes_go_to_log_and_replay(tmp_path):
+    path = tmp_path / "i.json"
+    idx = HashIndex.open(path, name="i", table_name="t", column_name="c")
+    idx.add(1, 1)
+    idx.save_if_dirty()  # no snapshot yet: full save
+    snapshot = path.read_bytes()
+
+    idx.add(1, 2)
+    idx.add("x", 3)
+    idx.remove(1, 1)
+    idx.save_if_dirty()
+    assert path.read_bytes() == snapshot
+    assert len(idx.log_path.read_bytes().splitlines()) == 3
+
+    with idx.log_path.open("ab") as f:
+        f.write(b'{"o":"+","k":"i:9"')  # torn final record is ignored
+    again = HashIndex.open(path, name="i", table_name="t", column_name="c")
+    assert again.mapping == idx.mapping
+
+    again.save()
+    assert not again.log_path.exists()
+    assert HashIndex.open(path, name="i", table_name="t", column_name="c").mapping == idx.mapping
+
+
+def test_index_buckets_stay_sorted_and_unique(tmp_path):
+    idx = HashIndex.open(tmp_path / "i.json", name="i", table_name="t", column_name="c")
+    for rid in (5, 2, 9, 2, 7):
+        idx.add("x", rid)
+    idx.remove("x", 9)
+    idx.remove("x", 4)  # absent rid is a no-op
+    assert idx.lookup("x") == [2, 5, 7]
+    for rid in (2, 5, 7):
+        idx.remove("x", rid)
+    assert idx.lookup("x") == [] and idx.distinct_keys == 0
+
+
+def test_rid_directory_binary_appends_and_reloads(tmp_path):
+    with HeapTable.open(tmp_path, "t") as heap:  # close() flushes buffered rows
+        rids = [heap.insert({"v": i}) for i in range(5)]
+    path = heap.rid_dir.path
+    assert path.stat().st_size == 16 * len(rids)
+
+    with path.open("ab") as f:
+        f.write(b"\x01\x02\x03")  # torn trailing record is dropped
+    again = HeapTable.open(tmp_path, "t")
+    assert list(again.rid_dir.items()) == list(heap.rid_dir.items())
+    assert [again.get_by_rid(r)["v"] for r in rids] == list(range(5))
+
+    again.rid_dir.set(rids[0], heap.rid_dir.get(rids[1]))  # later record wins
+    assert RidDirectory.open(path).get(rids[0]) == heap.rid_dir.get(rids[1])
+
+
+def test_tombstones_flush_appends_log_and_replays(tmp_path):
+    heap = HeapTable.open(tmp_path, "t")
+    rids = [heap.insert({"v": i}) for i in range(4)]
+    snapshot = heap.tombstones.path.read_text(encoding="utf-8")
+
+    heap.tombstone(rids[0])
+    heap.tombstone(rids[2])
+    assert heap.tombstones.dirty
+    assert heap.flush() is True
+    assert heap.flush() is False
+    assert heap.tombstones.path.read_text(encoding="utf-8") == snapshot  # log only
+
+    fresh = HeapTable.open(tmp_path, "t")
+    assert [r["v"] for r in fresh.scan_active()] == [1, 3]
+
+    fresh.tombstones.save()
+    assert not fresh.tombstones.log_path.exists()
+    assert HeapTable.open(tmp_path, "t").tombstones.deleted == {rids[0], rids[2]}
+
+
+def test_heap_buffers_inserts_until_flush(tmp_path):
+    heap = HeapTable.open(tmp_path, "t")
+    r1 = heap.insert({"v": 1})
+    fh = heap._append_fh
+    r2 = heap.insert({"v": 2})
+    assert heap._append_fh is fh  # one handle for all inserts
+    assert heap.get_by_rid(r2)["v"] == 2  # own reads see buffered rows
+
+    heap.insert({"v": 3})
+    assert len(HeapTable.open(tmp_path, "t").scan_active()) == 2
+    heap.flush()
+    assert [r["_rid"] for r in HeapTable.open(tmp_path, "t").scan_active()][:2] == [r1, r2]
+    assert len(HeapTable.open(tmp_path, "t").scan_active()) == 3
+
+    heap.close()
+    assert heap._append_fh is None
+    r4 = heap.insert({"v": 4})  # reopens the handle at the right offset
+    heap.close()
+    assert HeapTable.open(tmp_path, "t").get_by_rid(r4)["v"] == 4
+
+
+def test_heap_next_rid_persisted_on_flush(tmp_path):
+    heap = HeapTable.open(tmp_path, "t")
+    meta = heap.meta_path.read_bytes()
+    r1 = heap.insert({"v": 1})
+    assert heap.meta_path.read_bytes() == meta  # no meta write per insert
+    heap.flush()
+    assert heap.meta_path.read_bytes() != meta
+    assert HeapTable.open(tmp_path, "t")._next_rid == r1 + 1
+
+    r2 = heap.insert({"v": 2})
+    heap._flush_appends()  # rows and rid dir on disk, meta still stale
+    assert HeapTable.open(tmp_path, "t").insert({"v": 3}) == r2 + 1
+
+
+def test_rebuild_directory_matches_insert_offsets(tmp_path):
+    with HeapTable.open(tmp_path, "t") as heap:
+        for i in range(20):
+            heap.insert({"v": "é" * i})  # multi-byte lines
+    expected = list(heap.rid_dir.items())
+
+    heap.rid_dir.path.unlink()
+    rebuilt = HeapTable.open(tmp_path, "t")  # empty directory -> rebuilt from data
+    assert list(rebuilt.rid_dir.items()) == expected
+
+
+def test_get_by_rid_reads_records_of_any_length(tmp_path):
+    with HeapTable.open(tmp_path, "t") as heap:
+        short = heap.insert({"v": "x"})
+        long_mid = heap.insert({"v": "y" * 10_000})
+        long_last = heap.insert({"v": "z" * 10_000})  # no next offset to size the read
+
+    fresh = HeapTable.open(tmp_path, "t")
+    assert fresh.get_by_rid(short)["v"] == "x"
+    assert fresh.get_by_rid(long_mid)["v"] == "y" * 10_000
+    assert fresh.get_by_rid(long_last)["v"] == "z" * 10_000
+    fresh.close()
+
+
+def test_heap_insert_many_matches_single_inserts(tmp_path):
+    with HeapTable.open(tmp_path, "t") as heap:
+        first = heap.insert({"v": 0})
+        rids = heap.insert_many({"v": i} for i in range(1, 4))
+        assert heap.insert_many([]) == []
+        last = heap.insert({"v": 4})
+    assert rids == [first + 1, first + 2, first + 3] and last == first + 4
+
+    fresh = HeapTable.open(tmp_path, "t")
+    assert [fresh.get_by_rid(r)["v"] for r in [first, *rids, last]] == [0, 1, 2, 3, 4]
+    assert list(fresh.rid_dir.items()) == list(heap.rid_dir.items())
+
+
+def test_rid_directory_array_handles_gaps_and_out_of_order_records(tmp_path):
+    rd = RidDirectory.open(tmp_path / "d.bin")
+    assert rd.get(1) is None and rd.max_rid() == 0
+    rd.set_many([(5, 500), (2, 200)])
+    rd.set(2, 250)  # later record wins
+    assert [rd.get(r) for r in (0, 1, 2, 5, 6, -1)] == [None, None, 250, 500, None, None]
+    assert len(rd) == 2 and rd.max_rid() == 5
+
+    again = RidDirectory.open(tmp_path / "d.bin")
+    assert list(again.items()) == [(2, 250), (5, 500)]
+    again.save()
+    assert list(RidDirectory.open(tmp_path / "d.bin").items()) == [(2, 250), (5, 500)]
+
+
+def test_heap_bulk_flushes_once_on_exit(tmp_path):
+    heap = HeapTable.open(tmp_path, "t")
+    keep = heap.insert({"v": 0})
+    heap.flush()
+    with heap.bulk():
+        with heap.bulk():  # nested blocks flush once, at the outermost exit
+            rids = [heap.insert({"v": i}) for i in range(1, 4)]
+            rids += heap.insert_many([{"v": 4}])
+        heap.tombstone(keep)
+        assert heap.rid_dir.path.stat().st_size == 16  # only the first insert
+    assert heap.rid_dir.path.stat().st_size == 16 * 5
+
+    fresh = HeapTable.open(tmp_path, "t")
+    assert [r["v"] for r in fresh.scan_active()] == [1, 2, 3, 4]
+
+
+def test_rid_directory_never_points_past_unflushed_rows(tmp_path):
+    heap = HeapTable.open(tmp_path, "t")
+    heap.insert({"v": 1})
+    heap.flush()
+    heap.insert({"v": 2})  # still in the append buffer: no directory entry yet
+    assert heap.rid_dir.path.stat().st_size == 16
+
+    other = HeapTable.open(tmp_path, "t")
+    r = other.insert({"v": 3})
+    other.flush()
+    assert HeapTable.open(tmp_path, "t").get_by_rid(r)["v"] == 3
+
+
+def test_open_indexes_rows_written_without_directory_entries(tmp_path):
+    heap = HeapTable.open(tmp_path, "t")
+    r1 = heap.insert({"v": 1})
+    heap.flush()
+    r2 = heap.insert({"v": 2})
+    heap._append_fh.flush()  # as at interpreter exit: data on disk, no entry
+
+    fresh = HeapTable.open(tmp_path, "t")
+    assert fresh.get_by_rid(r2)["v"] == 2
+    assert fresh.insert({"v": 3}) == r2 + 1
+    assert RidDirectory.open(fresh.rid_dir.path).get(r2) is not None
+    assert [fresh.get_by_rid(r)["v"] for r in (r1, r2)] == [1, 2]